@@ -17,8 +17,8 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QAbstractItemView, QApplication, QComboBox, QDialog,
     QGridLayout, QGroupBox, QHeaderView, QLineEdit,
-    QPushButton, QSizePolicy, QTableWidget, QTableWidgetItem,
-    QVBoxLayout, QWidget)
+    QPushButton, QSizePolicy, QTableView, QVBoxLayout,
+    QWidget)
 
 class Ui_Dialog(object):
     def setupUi(self, Dialog):
@@ -374,15 +374,7 @@ class Ui_Dialog(object):
 
         self.gridLayout_2.addWidget(self.btn_right, 1, 3, 1, 1)
 
-        self.tbl_values = QTableWidget(self.grp_list)
-        if (self.tbl_values.columnCount() < 2):
-            self.tbl_values.setColumnCount(2)
-        __qtablewidgetitem = QTableWidgetItem()
-        __qtablewidgetitem.setText(u"TYPE");
-        self.tbl_values.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        __qtablewidgetitem1.setText(u"VALUE");
-        self.tbl_values.setHorizontalHeaderItem(1, __qtablewidgetitem1)
+        self.tbl_values = QTableView(self.grp_list)
         self.tbl_values.setObjectName(u"tbl_values")
         font9 = QFont()
         font9.setFamilies([u"Consolas"])
@@ -15,8 +15,8 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QDialog, QGridLayout, QListView,
-    QListWidget, QListWidgetItem, QSizePolicy, QWidget)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QGridLayout,
+    QLineEdit, QListView, QSizePolicy, QWidget)
 
 class Ui_Dialog(object):
     def setupUi(self, Dialog):
@@ -45,12 +45,19 @@ class Ui_Dialog(object):
         Dialog.setWindowFilePath(u"")
         self.gridLayout = QGridLayout(Dialog)
         self.gridLayout.setObjectName(u"gridLayout")
-        self.lst = QListWidget(Dialog)
-        self.lst.setObjectName(u"lst")
-        self.lst.setMinimumSize(QSize(221, 0))
+        self.tx_filter = QLineEdit(Dialog)
+        self.tx_filter.setObjectName(u"tx_filter")
         font1 = QFont()
         font1.setFamilies([u"Consolas"])
         font1.setPointSize(12)
+        self.tx_filter.setFont(font1)
+        self.tx_filter.setPlaceholderText(u"Filter...")
+
+        self.gridLayout.addWidget(self.tx_filter, 0, 0, 1, 1)
+
+        self.lst = QListView(Dialog)
+        self.lst.setObjectName(u"lst")
+        self.lst.setMinimumSize(QSize(221, 0))
         self.lst.setFont(font1)
 #if QT_CONFIG(tooltip)
         self.lst.setToolTip(u"")
@@ -68,15 +75,19 @@ class Ui_Dialog(object):
         self.lst.setAccessibleDescription(u"")
 #endif // QT_CONFIG(accessibility)
         self.lst.setLocale(QLocale(QLocale.English, QLocale.UnitedKingdom))
+        self.lst.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.lst.setAlternatingRowColors(True)
         self.lst.setProperty("isWrapping", False)
+        self.lst.setLayoutMode(QListView.Batched)
         self.lst.setViewMode(QListView.ListMode)
-        self.lst.setUniformItemSizes(False)
+        self.lst.setUniformItemSizes(True)
+        self.lst.setBatchSize(1000)
         self.lst.setWordWrap(False)
         self.lst.setSelectionRectVisible(False)
 
-        self.gridLayout.addWidget(self.lst, 0, 0, 2, 1)
+        self.gridLayout.addWidget(self.lst, 1, 0, 1, 1)
 
+        QWidget.setTabOrder(self.tx_filter, self.lst)
 
         self.retranslateUi(Dialog)
 
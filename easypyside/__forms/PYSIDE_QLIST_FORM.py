@@ -15,9 +15,9 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QDialog, QGridLayout, QLineEdit,
-    QListView, QListWidget, QListWidgetItem, QPushButton,
-    QSizePolicy, QWidget)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QGridLayout,
+    QLineEdit, QListView, QPushButton, QSizePolicy,
+    QWidget)
 
 class Ui_Dialog(object):
     def setupUi(self, Dialog):
@@ -75,7 +75,7 @@ class Ui_Dialog(object):
 
         self.gridLayout.addWidget(self.tx_newitem, 0, 0, 1, 1)
 
-        self.lst_items = QListWidget(Dialog)
+        self.lst_items = QListView(Dialog)
         self.lst_items.setObjectName(u"lst_items")
         self.lst_items.setMinimumSize(QSize(221, 0))
         self.lst_items.setFont(font1)
@@ -95,10 +95,14 @@ class Ui_Dialog(object):
         self.lst_items.setAccessibleDescription(u"")
 #endif // QT_CONFIG(accessibility)
         self.lst_items.setLocale(QLocale(QLocale.English, QLocale.UnitedKingdom))
+        self.lst_items.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.lst_items.setAlternatingRowColors(True)
+        self.lst_items.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.lst_items.setProperty("isWrapping", False)
+        self.lst_items.setLayoutMode(QListView.Batched)
         self.lst_items.setViewMode(QListView.ListMode)
-        self.lst_items.setUniformItemSizes(False)
+        self.lst_items.setUniformItemSizes(True)
+        self.lst_items.setBatchSize(1000)
         self.lst_items.setWordWrap(False)
         self.lst_items.setSelectionRectVisible(False)
 
@@ -7,3 +7,15 @@ Sub-Library of PySide6 with simplified Python Functions
     - tools
     - widgets
 '''
+
+from importlib import import_module as _import_module
+
+_MODULES = ("forms", "resources", "tools", "widgets")
+
+def __getattr__(name: str):
+    '''
+    PEP 562: submodules are imported on first access (easypyside.widgets, ...)
+    '''
+    if name in _MODULES:
+        return _import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,14 +3,25 @@ PySide6 Custom Forms Toolkit for development
 '''
 __update__ = '2024.09.08'
 
-from typing import Tuple, List, Dict, Union
+from typing import Any, Callable, Iterable, Tuple, List, Dict, Union, TYPE_CHECKING
 from dataclasses import dataclass
+import json
+import os
+import re
+from importlib import import_module
+from queue import Empty, SimpleQueue
+from struct import Struct
 
-from PySide6.QtGui import QIcon, QFont, QCloseEvent
-from PySide6.QtWidgets import QDialog, QMessageBox, QInputDialog, QHeaderView
-import markdown2
+from PySide6.QtCore import Qt, QEvent, QObject, QTimer, QAbstractTableModel, QModelIndex, QStringListModel, QItemSelection, QItemSelectionModel
+from PySide6.QtGui import QIcon, QFont, QCloseEvent, QShowEvent, QHideEvent, QKeySequence, QShortcut
+from PySide6.QtWidgets import QApplication, QDialog, QMessageBox, QInputDialog, QHeaderView, QWidget, QTableView, QAbstractItemView
+from shiboken6 import isValid
+# markdown2, the Qt resources (RESOURCES_INIT) and the __forms.PYSIDE_* modules are imported on first use
 
-import easypyside.resources ## Resources
+from easypyside.tools import ICON_GET, RESOURCES_INIT, SCHEDULER_GET, SI_PARSE, SI_PARSE_VALUE, PrefixIndex, PrefixIndexWorker
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 from easypyside.widgets import CELL_WR, CELL_RD, CELL_CHECKBOX, CELL_SPINBOX, CELL_COMBOBOX, CELL_READONLY
 
 
@@ -20,52 +31,116 @@ ________________________________________________________________________________
 
 # ICO_INFO = QIcon(":/__forms/info.ico")
 
-def INFOBOX(info: str, winTitle: str = "INFO", icon: QIcon = None) -> None:
+def _ICO_INFO() -> QIcon:
     '''
-    Information Window
+    Default icon of the forms, shared by all the dialogs (the Qt resources are registered on first use)
     '''
-    infobox = QMessageBox()
-    infobox.setIcon(QMessageBox.Icon.Information)
-    infobox.setFont(QFont('Consolas', 10))
-    infobox.setWindowTitle(winTitle)
-    infobox.setText(info)
-    infobox.setWindowIcon(QIcon(":/__forms/info.ico"))
-    if icon:
-        infobox.setWindowIcon(icon)
+    RESOURCES_INIT()
+    return ICON_GET(":/__forms/info.ico")
 
-    infobox.setMinimumWidth(400)
-    infobox.exec()
+_DIALOGS: Dict[tuple, QDialog] = {} # Dialog pool: {(BOX, id(parent)): dialog}
 
-def YESNOBOX(info: str, winTitle: str = "QUESTION", icon: QIcon = None) -> bool:
+def _DIALOG_GET(BOX: str, SETUP, parent: QWidget = None) -> QDialog:
     '''
-    Question Window with YES/NO Options
+    Pooled dialog of a type (BOX) for a parent window, built with SETUP(parent) the first time
+
+    ** A new (not pooled) dialog is built if the pooled one is already shown (nested prompts)
+    ** The entry is dropped when the dialog is destroyed (with its parent), so transient parents don't pile up
+    '''
+    KEY = (BOX, id(parent))
+    DIALOG = _DIALOGS.get(KEY)
+    if DIALOG is not None and isValid(DIALOG) and DIALOG.parent() is parent:
+        if DIALOG.isVisible():
+            return SETUP(parent)
+        return DIALOG
+    DIALOG = _DIALOGS[KEY] = SETUP(parent)
+    DIALOG.destroyed.connect(lambda *args, KEY=KEY, ID=id(DIALOG): _DIALOG_DROP(KEY, ID))
+    return DIALOG
+
+def _DIALOG_DROP(KEY: tuple, ID: int) -> None:
     '''
-    yesnobox = QMessageBox()
+    Remove a destroyed dialog from the pool (only if the entry is still that dialog)
+    '''
+    if id(_DIALOGS.get(KEY)) == ID:
+        del _DIALOGS[KEY]
+
+def DIALOG_POOL_CLEAR() -> None:
+    '''
+    Release the pooled INFOBOX / YESNOBOX / INPUTBOX dialogs
+    '''
+    for DIALOG in _DIALOGS.values():
+        if isValid(DIALOG):
+            DIALOG.deleteLater()
+    _DIALOGS.clear()
+
+def _INFOBOX_SETUP(parent: QWidget = None) -> QMessageBox:
+    infobox = QMessageBox(parent)
+    infobox.setIcon(QMessageBox.Icon.Information)
+    infobox.setFont(QFont('Consolas', 10))
+    infobox.setMinimumWidth(400)
+    return infobox
+
+def _YESNOBOX_SETUP(parent: QWidget = None) -> QMessageBox:
+    yesnobox = QMessageBox(parent)
     yesnobox.setFont(QFont('Consolas', 10))
     yesnobox.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
     yesnobox.setIcon(QMessageBox.Icon.Question)
+    return yesnobox
+
+def _INPUTBOX_SETUP(parent: QWidget = None) -> QInputDialog:
+    return QInputDialog(parent)
+
+def _INFOBOX(info: str, winTitle: str, icon: QIcon, parent: QWidget) -> QMessageBox:
+    infobox: QMessageBox = _DIALOG_GET("INFOBOX", _INFOBOX_SETUP, parent)
+    infobox.setWindowTitle(winTitle)
+    infobox.setText(info)
+    infobox.setWindowIcon(icon if icon else _ICO_INFO())
+    return infobox
+
+def _YESNOBOX(info: str, winTitle: str, icon: QIcon, parent: QWidget) -> QMessageBox:
+    yesnobox: QMessageBox = _DIALOG_GET("YESNOBOX", _YESNOBOX_SETUP, parent)
     yesnobox.setWindowTitle(winTitle)
     yesnobox.setText(info)
-    yesnobox.setWindowIcon(QIcon(":/__forms/info.ico"))
-    if icon:
-        yesnobox.setWindowIcon(icon)
-    reply = yesnobox.exec()
-    if reply == yesnobox.StandardButton.Yes:
+    yesnobox.setWindowIcon(icon if icon else _ICO_INFO())
+    return yesnobox
+
+def _YESNOBOX_REPLY(reply: int) -> bool:
+    if reply == QMessageBox.StandardButton.Yes:
         return True
-    if reply == yesnobox.StandardButton.No:
+    if reply == QMessageBox.StandardButton.No:
         return False
 
-def INPUTBOX(info: str = None, winTitle: str = "INPUT", icon: QIcon = None) -> str:
+def _INPUTBOX(info: str, winTitle: str, icon: QIcon, parent: QWidget) -> QInputDialog:
+    inputbox: QInputDialog = _DIALOG_GET("INPUTBOX", _INPUTBOX_SETUP, parent)
+    inputbox.setWindowIcon(icon if icon else _ICO_INFO())
+    inputbox.setWindowTitle(winTitle)
+    inputbox.setLabelText(info if info else "")
+    inputbox.setTextValue("")
+    return inputbox
+
+def INFOBOX(info: str, winTitle: str = "INFO", icon: QIcon = None, parent: QWidget = None) -> None:
+    '''
+    Information Window
+
+    ** The dialog is pooled by parent window and reused in the next calls
+    '''
+    _INFOBOX(info, winTitle, icon, parent).exec()
+
+def YESNOBOX(info: str, winTitle: str = "QUESTION", icon: QIcon = None, parent: QWidget = None) -> bool:
+    '''
+    Question Window with YES/NO Options
+
+    ** The dialog is pooled by parent window and reused in the next calls
+    '''
+    return _YESNOBOX_REPLY(_YESNOBOX(info, winTitle, icon, parent).exec())
+
+def INPUTBOX(info: str = None, winTitle: str = "INPUT", icon: QIcon = None, parent: QWidget = None) -> str:
     '''
     Input Window for Entering a Value
+
+    ** The dialog is pooled by parent window and reused in the next calls (the text is cleared)
     '''
-    inputbox = QInputDialog()
-    inputbox.setWindowIcon(QIcon(":/__forms/info.ico"))
-    if icon:
-        inputbox.setWindowIcon(icon)
-    inputbox.setWindowTitle(winTitle)
-    if info:
-        inputbox.setLabelText(info)
+    inputbox = _INPUTBOX(info, winTitle, icon, parent)
     reply = inputbox.exec()
     if reply:
         return inputbox.textValue()
@@ -74,15 +149,107 @@ def INPUTBOX(info: str = None, winTitle: str = "INPUT", icon: QIcon = None) -> s
 
 
 
+''' ASYNC FORMS
+________________________________________________________________________________________________ '''
+
+class _DialogWaiter(QObject):
+    '''
+    Event filter: resolve the future with RESULT() when the dialog is hidden (accept, reject, close)
+    '''
+    def __init__(self, future, RESULT: Callable[[], Any]):
+        super().__init__()
+        self.future = future
+        self.RESULT = RESULT
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Hide and not event.spontaneous() and not self.future.done():
+            self.future.set_result(self.RESULT())
+        return False
+
+async def _DIALOG_ASYNC(DIALOG: QDialog, RESULT: Callable[[], Any]) -> Any:
+    '''
+    Show the dialog non-modally and wait until it's hidden, return RESULT()
+
+    ** If the waiting task is cancelled the dialog is rejected
+    '''
+    import asyncio
+    future = asyncio.get_running_loop().create_future()
+    WAITER = _DialogWaiter(future, RESULT)
+    DIALOG.installEventFilter(WAITER)
+    DIALOG.setResult(0)
+    DIALOG.setModal(False)
+    DIALOG.show()
+    try:
+        return await future
+    finally:
+        if isValid(DIALOG):
+            DIALOG.removeEventFilter(WAITER)
+            if DIALOG.isVisible(): # cancelled
+                DIALOG.done(QDialog.DialogCode.Rejected)
+
+async def INFOBOX_ASYNC(info: str, winTitle: str = "INFO", icon: QIcon = None, parent: QWidget = None) -> None:
+    '''
+    Awaitable INFOBOX, the event loop keeps running while the dialog is shown
+
+    ** Requires an asyncio event loop that processes the Qt events, for example:
+        PySide6.QtAsyncio.run(main()) (Python >= 3.12 with PySide6 6.8) or a plain asyncio loop
+        that calls QApplication.processEvents() (README example)
+    '''
+    await _DIALOG_ASYNC(_INFOBOX(info, winTitle, icon, parent), lambda: None)
+
+async def YESNOBOX_ASYNC(info: str, winTitle: str = "QUESTION", icon: QIcon = None, parent: QWidget = None) -> bool:
+    '''
+    Awaitable YESNOBOX, same return values (None if the dialog is closed without answer)
+    '''
+    yesnobox = _YESNOBOX(info, winTitle, icon, parent)
+    return await _DIALOG_ASYNC(yesnobox, lambda: _YESNOBOX_REPLY(yesnobox.result()))
+
+async def INPUTBOX_ASYNC(info: str = None, winTitle: str = "INPUT", icon: QIcon = None, parent: QWidget = None) -> str:
+    '''
+    Awaitable INPUTBOX, same return values
+    '''
+    inputbox = _INPUTBOX(info, winTitle, icon, parent)
+    return await _DIALOG_ASYNC(inputbox, lambda: inputbox.textValue() if inputbox.result() else None)
+
+async def FORM_ASYNC(FORM: QDialog) -> Any:
+    '''
+    Show a custom form (QLIST, QLIST_FORM, QTABLE_FORM, QACQUISITIONS, QTEXT_FORM, QMARKDOWN...)
+    non-modally and wait until it's closed
+
+    `Returns:` FORM.data, the same payload read after FORM.exec()
+
+    ** Example:
+        data = await FORM_ASYNC(QLIST(["A", "B"]))
+    '''
+    return await _DIALOG_ASYNC(FORM, lambda: getattr(FORM, "data", None))
+
+
+
 ''' Qt CUSTOM FORMS
 ________________________________________________________________________________________________ '''
 
-from .__forms import PYSIDE_QLIST
-from .__forms import PYSIDE_QLIST_FORM
-from .__forms import PYSIDE_QTABLE_FORM
-from .__forms import PYSIDE_QMARKDOWN
-from .__forms import PYSIDE_QACQUISITIONS
-from .__forms import PYSIDE_QTEXT_FORM
+_UI_MODULES: Tuple[str] = (
+    "PYSIDE_QLIST",
+    "PYSIDE_QLIST_FORM",
+    "PYSIDE_QTABLE_FORM",
+    "PYSIDE_QMARKDOWN",
+    "PYSIDE_QACQUISITIONS",
+    "PYSIDE_QTEXT_FORM",
+)
+
+def _UI(NAME: str):
+    '''
+    Generated UI module of a form (__forms.PYSIDE_*), imported when the form is first built
+    '''
+    return import_module(f".__forms.{NAME}", __package__)
+
+def __getattr__(name: str):
+    '''
+    PEP 562: forms.PYSIDE_* modules are still available as attributes, loaded on first access
+    '''
+    if name in _UI_MODULES:
+        return _UI(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class QLIST(QDialog):
     '''
@@ -90,36 +257,255 @@ class QLIST(QDialog):
     
     Get an avalilable <str> data from the list
 
+    ** The QListView shows a QStringListModel (no item object per element, uniform item sizes, batched layout)
+    ** Type-ahead filter (tx_filter, Enter selects the current / first match): the items that start with
+       the text are searched in a PrefixIndex, built once in a worker thread, and shown in self.filtered
+       (a QStringListModel with a copy of the matches, not a proxy: self.filtered_rows[row] is the row in self.model)
+
     `Returns:` str
     '''
     def __init__(self, LIST: list | tuple, Window_Title: str="List", icon: QIcon = None):
         QDialog.__init__(self)
 
         ''' INIT '''
-        self.ui = PYSIDE_QLIST.Ui_Dialog()
+        self.ui = _UI("PYSIDE_QLIST").Ui_Dialog()
         self.ui.setupUi(self)
-        self.setWindowIcon(QIcon(":/__forms/info.ico"))
+        self.setWindowIcon(_ICO_INFO())
         if icon: self.setWindowIcon(icon)
         self.setWindowTitle(Window_Title)
 
         ''' WIDGETS '''
-        for item in LIST:
-            self.ui.lst.addItem(item)
+        ITEMS: List[str] = list(LIST)
+        self.model = QStringListModel(ITEMS, self)
+        self.filtered = QStringListModel(self) # Filtered items
+        self.filtered_rows: 'np.ndarray' = None # Filtered row -> self.model row
+        self.ui.lst.setModel(self.model)
         self.data: str = None
 
+        ''' FILTER INDEX '''
+        self.index: PrefixIndex = None
+        self._filter: Tuple[str, int, int] = ("", 0, len(ITEMS)) # Last filter and its index range
+        self._indexer = PrefixIndexWorker(ITEMS)
+        self._indexer.ready.connect(self._INDEX_READY)
+        QTimer.singleShot(0, self._indexer.start) # once the dialog is shown
+
         ''' CONNECTIONS '''
         self.ui.lst.doubleClicked.connect(self.DATA_SELECT)
-    
+        self.ui.tx_filter.textChanged.connect(self.FILTER)
+        self.ui.tx_filter.returnPressed.connect(self._FILTER_SELECT)
+
+    def _INDEX_READY(self, INDEX: PrefixIndex) -> None:
+        self.index = INDEX
+        self._indexer = None
+        if self.ui.tx_filter.text():
+            self.FILTER(self.ui.tx_filter.text())
+
+    def FILTER(self, TEXT: str) -> None:
+        '''
+        Show the items that start with TEXT (case insensitive)
+
+        ** If TEXT extends the previous filter, only the previous range of the index is searched
+        ** Applied when the index is ready if it's still being built
+        '''
+        if not TEXT:
+            self._filter = ("", 0, self.model.rowCount())
+            if self.ui.lst.model() is not self.model:
+                self.ui.lst.setModel(self.model)
+            return
+        if self.index is None:
+            return
+        PREFIX, LAST_LO, LAST_HI = self._filter
+        LO, HI = (LAST_LO, LAST_HI) if TEXT.casefold().startswith(PREFIX.casefold()) else (0, self.index.size)
+        LO, HI = self.index.range(TEXT, LO, HI)
+        self._filter = (TEXT, LO, HI)
+        if (LO, HI) == (0, self.index.size) and len(TEXT) <= PrefixIndex.KEY_LENGTH: # All the items
+            MODEL = self.model
+        else:
+            MODEL = self.filtered
+            if (LO, HI) != (LAST_LO, LAST_HI) or self.ui.lst.model() is not self.filtered or len(TEXT) > PrefixIndex.KEY_LENGTH:
+                self.filtered_rows = self.index.rows(TEXT, LO, HI)
+                self.filtered.setStringList(self.index.items[self.filtered_rows].tolist())
+        if self.ui.lst.model() is not MODEL:
+            self.ui.lst.setModel(MODEL)
+
+    def _FILTER_SELECT(self) -> None:
+        if not self.ui.lst.currentIndex().isValid():
+            self.ui.lst.setCurrentIndex(self.ui.lst.model().index(0, 0))
+        self.DATA_SELECT()
+
     def DATA_SELECT(self) -> None:
-        self.data = self.ui.lst.currentItem().text()
+        INDEX = self.ui.lst.currentIndex()
+        if not INDEX.isValid():
+            return
+        self.data = INDEX.data()
         self.close()
 
+def _ROW_RUNS(RUNS: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    '''
+    Sort and merge (overlapping / adjacent) runs of rows [(start, count), ...]
+    '''
+    MERGED: List[list] = []
+    for start, count in sorted(RUNS):
+        if count <= 0:
+            continue
+        if MERGED and start <= MERGED[-1][0] + MERGED[-1][1]:
+            MERGED[-1][1] = max(MERGED[-1][1], start + count - MERGED[-1][0])
+        else:
+            MERGED.append([start, count])
+    return [(start, count) for start, count in MERGED]
+
+class EditableListModel(QStringListModel):
+    '''
+    QStringListModel that keeps its strings in a Python list (self.items) updated on every change
+
+    insertRows / removeRows / moveRows / setData / setStringList apply the same slice operation to
+    self.items, so the list is never read back from the model. The view layout stays in C++
+    (rowCount / data aren't overridden).
+
+    ** Batch edits over runs of rows [(start, count), ...]: add / remove / move, one model operation per run
+       (a single model reset if there are more than RESET rows / runs: QStringListModel inserts row by row)
+    ** sort() isn't mirrored, don't use it
+    '''
+    RESET: int = 256
+
+    def __init__(self, ITEMS: Iterable[str] = None, parent=None):
+        ITEMS = [str(item) for item in ITEMS] if ITEMS else []
+        super().__init__(ITEMS, parent)
+        self.items: List[str] = ITEMS
+
+    def setStringList(self, ITEMS: Iterable[str]) -> None:
+        ITEMS = [str(item) for item in ITEMS]
+        super().setStringList(ITEMS)
+        self.items[:] = ITEMS
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not super().setData(index, value, role):
+            return False
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            self.items[index.row()] = str(value)
+        return True
+
+    def insertRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if not super().insertRows(row, count, parent):
+            return False
+        self.items[row:row] = [""] * count
+        return True
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if not super().removeRows(row, count, parent):
+            return False
+        del self.items[row:row + count]
+        return True
+
+    def moveRows(self, sourceParent: QModelIndex, sourceRow: int, count: int, destinationParent: QModelIndex, destinationChild: int) -> bool:
+        if not super().moveRows(sourceParent, sourceRow, count, destinationParent, destinationChild):
+            return False
+        ## Rotate only the rows between source and destination
+        ITEMS = self.items
+        if destinationChild > sourceRow:
+            ITEMS[sourceRow:destinationChild] = ITEMS[sourceRow + count:destinationChild] + ITEMS[sourceRow:sourceRow + count]
+        else:
+            ITEMS[destinationChild:sourceRow + count] = ITEMS[sourceRow:sourceRow + count] + ITEMS[destinationChild:sourceRow]
+        return True
+
+    def add(self, ITEMS: Iterable[str], ROW: int = None) -> Tuple[int, int]:
+        '''
+        Insert a block of items in ROW (default: at the end), with a single dataChanged notification
+
+        `Returns:` (row, count) of the block
+        '''
+        ITEMS = [str(item) for item in ITEMS]
+        ROW = len(self.items) if ROW is None else max(0, min(ROW, len(self.items)))
+        if len(ITEMS) > self.RESET:
+            self.setStringList(self.items[:ROW] + ITEMS + self.items[ROW:])
+            return ROW, len(ITEMS)
+        if not ITEMS or not self.insertRows(ROW, len(ITEMS)):
+            return ROW, 0
+        BLOCKED: bool = self.blockSignals(True)
+        try:
+            for row, item in enumerate(ITEMS, ROW):
+                super().setData(self.index(row, 0), item)
+        finally:
+            self.blockSignals(BLOCKED)
+        self.items[ROW:ROW + len(ITEMS)] = ITEMS
+        self.dataChanged.emit(self.index(ROW, 0), self.index(ROW + len(ITEMS) - 1, 0))
+        return ROW, len(ITEMS)
+
+    def remove(self, RUNS: Iterable[Tuple[int, int]]) -> int:
+        '''
+        Remove the runs of rows [(start, count), ...], from the bottom
+
+        `Returns:` number of removed rows
+        '''
+        RUNS = _ROW_RUNS(RUNS)
+        if len(RUNS) > self.RESET:
+            ITEMS: List[str] = []
+            LAST: int = 0
+            for start, count in RUNS:
+                ITEMS.extend(self.items[LAST:start])
+                LAST = start + count
+            ITEMS.extend(self.items[LAST:])
+            REMOVED: int = len(self.items) - len(ITEMS)
+            self.setStringList(ITEMS)
+            return REMOVED
+        REMOVED: int = 0
+        for start, count in reversed(RUNS):
+            if self.removeRows(start, count):
+                REMOVED += count
+        return REMOVED
+
+    def move(self, RUNS: Iterable[Tuple[int, int]], STEP: int) -> List[Tuple[int, int]]:
+        '''
+        Move the runs of rows [(start, count), ...] 1 position up (STEP < 0) or down (STEP > 0)
+
+        Each run is moved with a single moveRows of the row above / below it,
+        runs at the top / bottom (or stuck behind them) stay in place
+
+        `Returns:` new runs of the moved rows
+        '''
+        STEP = -1 if STEP < 0 else 1
+        ## PLAN: (start, count, moved) of each run
+        PLAN: List[Tuple[int, int, bool]] = []
+        if STEP < 0:
+            LIMIT: int = 0
+            for start, count in _ROW_RUNS(RUNS):
+                MOVED: bool = start > LIMIT
+                PLAN.append((start, count, MOVED))
+                LIMIT = start + count - MOVED
+        else:
+            LIMIT: int = len(self.items)
+            for start, count in reversed(_ROW_RUNS(RUNS)):
+                MOVED: bool = start + count < LIMIT
+                PLAN.append((start, count, MOVED))
+                LIMIT = start + MOVED
+        ## APPLY
+        if len(PLAN) > self.RESET:
+            ITEMS: List[str] = self.items[:]
+            for start, count, moved in PLAN:
+                if moved and STEP < 0:
+                    ITEMS[start - 1:start + count] = self.items[start:start + count] + [self.items[start - 1]]
+                elif moved:
+                    ITEMS[start:start + count + 1] = [self.items[start + count]] + self.items[start:start + count]
+            self.setStringList(ITEMS)
+        else:
+            for start, count, moved in PLAN:
+                if moved and STEP < 0:
+                    self.moveRows(QModelIndex(), start - 1, 1, QModelIndex(), start + count)
+                elif moved:
+                    self.moveRows(QModelIndex(), start + count, 1, QModelIndex(), start)
+        return _ROW_RUNS((start + STEP * moved, count) for start, count, moved in PLAN)
+
 class QLIST_FORM(QDialog):
     '''
     List Selection Form
 
     Get a List of <str> Values
 
+    ** The list is an EditableListModel (self.model.items, updated on each edit, no rebuild), self.data is
+       a copy of it (GET_ITEMS) taken when the dialog is hidden / closed, read self.model.items while it's open
+    ** Multi-selection (Shift / Ctrl): up / down / delete move or remove all the selected items
+    ** Ctrl+V pastes the clipboard lines after the selection, Ctrl+C copies the selected items, Del deletes them
+
     `Returns:` List[str]
     '''
     def __init__(self, LIST: Union[list, tuple] = None, Window_Title: str = "LIST EDIT", icon: QIcon = None, parent=None):
@@ -127,15 +513,15 @@ class QLIST_FORM(QDialog):
         self.data: List[str] = None
         
         ''' INIT '''
-        self.ui = PYSIDE_QLIST_FORM.Ui_Dialog()
+        self.ui = _UI("PYSIDE_QLIST_FORM").Ui_Dialog()
         self.ui.setupUi(self)
-        self.setWindowIcon(QIcon(":/__forms/info.ico"))
+        self.setWindowIcon(_ICO_INFO())
         if icon: self.setWindowIcon(icon)
         self.setWindowTitle(Window_Title)
 
         ''' WIDGETS '''
-        if LIST:
-            self.ui.lst_items.addItems([item for item in LIST])
+        self.model = EditableListModel(LIST, self)
+        self.ui.lst_items.setModel(self.model)
         self.GET_ITEMS()
         
         ''' CONNECTIONS '''
@@ -143,38 +529,100 @@ class QLIST_FORM(QDialog):
         self.ui.btn_del.clicked.connect(self.ITEM_DEL)
         self.ui.btn_up.clicked.connect(self.ITEM_UP)
         self.ui.btn_down.clicked.connect(self.ITEM_DOWN)
+        for KEYS, FUNCTION in (
+            (QKeySequence.StandardKey.Paste, self.ITEMS_PASTE),
+            (QKeySequence.StandardKey.Copy, self.ITEMS_COPY),
+            (QKeySequence.StandardKey.Delete, self.ITEM_DEL),
+        ):
+            SHORTCUT = QShortcut(KEYS, self.ui.lst_items, FUNCTION)
+            SHORTCUT.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
         
+    def _SELECTED_RUNS(self) -> List[Tuple[int, int]]:
+        '''
+        Selected runs of rows [(start, count), ...], the current row if nothing is selected
+        '''
+        RUNS = [(RANGE.top(), RANGE.height()) for RANGE in self.ui.lst_items.selectionModel().selection()]
+        if not RUNS and self.ui.lst_items.currentIndex().isValid():
+            RUNS = [(self.ui.lst_items.currentIndex().row(), 1)]
+        return _ROW_RUNS(RUNS)
+
+    def _SELECT(self, RUNS: List[Tuple[int, int]]) -> None:
+        '''
+        Select the runs of rows [(start, count), ...], the first row is the current row
+        '''
+        SELECTION = QItemSelection()
+        for start, count in RUNS:
+            SELECTION.select(self.model.index(start, 0), self.model.index(start + count - 1, 0))
+        SELECTION_MODEL = self.ui.lst_items.selectionModel()
+        SELECTION_MODEL.select(SELECTION, QItemSelectionModel.SelectionFlag.ClearAndSelect)
+        if RUNS:
+            FIRST = self.model.index(RUNS[0][0], 0)
+            SELECTION_MODEL.setCurrentIndex(FIRST, QItemSelectionModel.SelectionFlag.NoUpdate)
+            self.ui.lst_items.scrollTo(FIRST)
+
     def ITEM_ADD(self) -> None:
         ITEM: str = self.ui.tx_newitem.text()
         if ITEM and ITEM != "":
-            self.ui.lst_items.addItem(ITEM)
+            self._SELECT([self.model.add([ITEM])])
             self.ui.tx_newitem.clear()
-            self.GET_ITEMS()
     
     def ITEM_DEL(self) -> None:
-        if self.ui.lst_items.currentRow() < 0:
+        RUNS: List[Tuple[int, int]] = self._SELECTED_RUNS()
+        if not RUNS:
             return
-        if not YESNOBOX("ATTENTION", "DO YOU WANT TO DELETE THIS FIELD ?", icon=self.icon):
+        COUNT: int = sum(count for _, count in RUNS)
+        INFO: str = "DO YOU WANT TO DELETE THIS FIELD ?" if COUNT == 1 else f"DO YOU WANT TO DELETE THESE {COUNT} FIELDS ?"
+        if not YESNOBOX(INFO, "ATTENTION", icon=self.windowIcon(), parent=self):
             return
-        self.ui.lst_items.takeItem(self.ui.lst_items.currentIndex().row())
-        self.GET_ITEMS()
+        self.ui.lst_items.selectionModel().clear() # the selection model tracks every selected row on each removal
+        self.model.remove(RUNS)
+        if self.model.items:
+            self._SELECT([(min(RUNS[0][0], len(self.model.items) - 1), 1)])
     
     def ITEM_UP(self) -> None:
-        currentRow: int = self.ui.lst_items.currentRow()
-        currentItem = self.ui.lst_items.takeItem(currentRow)
-        self.ui.lst_items.insertItem(currentRow - 1, currentItem)
-        self.ui.lst_items.setCurrentRow(currentRow-1)
-        self.GET_ITEMS()
+        self._ITEMS_MOVE(-1)
         
     def ITEM_DOWN(self) -> None:
-        currentRow = self.ui.lst_items.currentRow()
-        currentItem = self.ui.lst_items.takeItem(currentRow)
-        self.ui.lst_items.insertItem(currentRow + 1, currentItem)
-        self.ui.lst_items.setCurrentRow(currentRow+1)
-        self.GET_ITEMS()
+        self._ITEMS_MOVE(1)
+
+    def _ITEMS_MOVE(self, STEP: int) -> None:
+        RUNS: List[Tuple[int, int]] = self._SELECTED_RUNS()
+        if not RUNS:
+            return
+        self.ui.lst_items.selectionModel().clear() # the selection model tracks every selected row on each move
+        self._SELECT(self.model.move(RUNS, STEP))
+
+    def ITEMS_PASTE(self, TEXT: str = None) -> int:
+        '''
+        Insert the lines of TEXT (default: clipboard) after the selected items (or at the end), empty lines are skipped
+
+        `Returns:` number of pasted items
+        '''
+        if TEXT is None:
+            TEXT = QApplication.clipboard().text()
+        ITEMS: List[str] = [line.strip() for line in TEXT.splitlines() if line.strip()]
+        RUNS: List[Tuple[int, int]] = self._SELECTED_RUNS()
+        self.ui.lst_items.selectionModel().clear()
+        ROW, COUNT = self.model.add(ITEMS, sum(RUNS[-1]) if RUNS else None)
+        if COUNT:
+            self._SELECT([(ROW, COUNT)])
+        return COUNT
+
+    def ITEMS_COPY(self) -> str:
+        '''
+        Copy the selected items to the clipboard (1 line per item)
+        '''
+        TEXT: str = "\n".join(item for start, count in self._SELECTED_RUNS() for item in self.model.items[start:start + count])
+        QApplication.clipboard().setText(TEXT)
+        return TEXT
     
+    def hideEvent(self, event: QHideEvent) -> None:
+        # close / accept / reject
+        self.GET_ITEMS()
+        super().hideEvent(event)
+
     def GET_ITEMS(self) -> None:
-        self.data = [self.ui.lst_items.item(x).text() for x in range(self.ui.lst_items.count())]
+        self.data = list(self.model.items)
 
 class QTABLE_FORM(QDialog):
     '''
@@ -204,9 +652,9 @@ class QTABLE_FORM(QDialog):
         self.data: Dict[str, Union[bool, str, int, float]] = None
 
         ## GUI
-        self.ui = PYSIDE_QTABLE_FORM.Ui_Dialog()
+        self.ui = _UI("PYSIDE_QTABLE_FORM").Ui_Dialog()
         self.ui.setupUi(self)
-        self.setWindowIcon(QIcon(":/__forms/info.ico"))
+        self.setWindowIcon(_ICO_INFO())
         if icon: self.setWindowIcon(icon)
         self.setWindowTitle(Window_Title)
         
@@ -298,17 +746,604 @@ class QMARKDOWN(QDialog):
         QDialog.__init__(self)
         
         ''' INIT '''
-        self.ui = PYSIDE_QMARKDOWN.Ui_Dialog()
+        self.ui = _UI("PYSIDE_QMARKDOWN").Ui_Dialog()
         self.ui.setupUi(self)
 
         ''' WIDGETS '''
-        self.setWindowIcon(QIcon(":/__forms/info.ico"))
+        self.setWindowIcon(_ICO_INFO())
         if icon: self.setWindowIcon(icon)
         self.setWindowTitle(Window_Title)
         self.ui.tx_preview.setReadOnly(True)
+        import markdown2
         html_text = markdown2.markdown(MD_TEXT)
         self.ui.tx_preview.setHtml(html_text)
 
+def _GROW(ARRAY: 'np.ndarray', SIZE: int) -> 'np.ndarray':
+    '''
+    Return ARRAY or a copy with capacity >= SIZE (doubling, amortized O(1) appends)
+    '''
+    if SIZE <= len(ARRAY):
+        return ARRAY
+    import numpy as np
+    NEW = np.empty(max(SIZE, 2 * len(ARRAY), 16), dtype=ARRAY.dtype)
+    NEW[:len(ARRAY)] = ARRAY
+    return NEW
+
+def _FLOAT(VALUE: Any) -> float:
+    try:
+        return float(VALUE)
+    except:
+        return 0.0
+
+class RunningStats:
+    '''
+    Running statistics of a measurement type: count, mean, std (sample), min, max, last
+
+    Samples are merged in O(1) per sample (Welford), blocks with the parallel merge of Chan et al.
+    '''
+    __slots__ = ("count", "mean", "m2", "min", "max", "last")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.count: int = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+        self.min: float = float("nan")
+        self.max: float = float("nan")
+        self.last: float = float("nan")
+
+    def add(self, VALUE: float) -> None:
+        '''
+        Welford update with one sample
+        '''
+        self.count += 1
+        DELTA = VALUE - self.mean
+        self.mean += DELTA / self.count
+        self.m2 += DELTA * (VALUE - self.mean)
+        self.min = VALUE if self.count == 1 else min(self.min, VALUE)
+        self.max = VALUE if self.count == 1 else max(self.max, VALUE)
+        self.last = VALUE
+
+    def add_many(self, VALUES: 'np.ndarray') -> None:
+        '''
+        Merge a block of samples (float64 array)
+        '''
+        N = len(VALUES)
+        if N == 0:
+            return
+        if N == 1:
+            self.add(float(VALUES[0]))
+            return
+        MEAN = float(VALUES.mean())
+        M2 = float(((VALUES - MEAN) ** 2).sum())
+        COUNT = self.count + N
+        DELTA = MEAN - self.mean
+        self.m2 += M2 + DELTA * DELTA * self.count * N / COUNT
+        self.mean += DELTA * N / COUNT
+        MIN, MAX = float(VALUES.min()), float(VALUES.max())
+        self.min = MIN if self.count == 0 else min(self.min, MIN)
+        self.max = MAX if self.count == 0 else max(self.max, MAX)
+        self.count = COUNT
+        self.last = float(VALUES[-1])
+
+    def recompute(self, VALUES: 'np.ndarray') -> None:
+        '''
+        Statistics from all the values of the type (after a delete)
+        '''
+        self.reset()
+        self.add_many(VALUES)
+
+    @property
+    def std(self) -> float:
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else float("nan")
+
+class AcquisitionsStore:
+    '''
+    Columnar store of acquisitions: a growable float64 NumPy array per measurement type,
+    plus the type / position of each row in arrival order (table view)
+
+    The dict of lists (data) is kept incrementally, adds and deletes don't rebuild it
+
+    ** stats: {type: RunningStats} updated with each add / set / delete
+    ** Each row has a stable id (order of addition), used by the journal (AcquisitionsJournal)
+    ** arrays() -> {type: float64 array view} (no copy)
+    ** dataframe() -> DataFrame TYPE (categorical) / VALUE in arrival order
+    '''
+    def __init__(self, TYPES: List[str] = None):
+        import numpy as np
+        self.types: List[str] = []
+        self.data: Dict[str, List[float]] = {}
+        self.stats: Dict[str, RunningStats] = {}
+        self._codes: Dict[str, int] = {}
+        self._values: List['np.ndarray'] = []
+        self._counts: List[int] = []
+        self._row_type = np.empty(0, dtype=np.int32)
+        self._row_pos = np.empty(0, dtype=np.int64)
+        self._row_id = np.empty(0, dtype=np.int64)
+        self.size: int = 0
+        self.next_id: int = 0
+        self.journal: AcquisitionsJournal = None
+        for TYPE in TYPES or []:
+            self.type_code(TYPE)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def type_code(self, TYPE: str) -> int:
+        '''
+        Code of a measurement type (registered if it's new)
+        '''
+        CODE = self._codes.get(TYPE)
+        if CODE is None:
+            import numpy as np
+            CODE = self._codes[TYPE] = len(self.types)
+            self.types.append(TYPE)
+            self.data[TYPE] = []
+            self.stats[TYPE] = RunningStats()
+            self._values.append(np.empty(0, dtype=np.float64))
+            self._counts.append(0)
+            if self.journal:
+                self.journal.add_type(TYPE)
+        return CODE
+
+    @classmethod
+    def from_arrays(cls, TYPES: List[str], CODES: 'np.ndarray', VALUES: 'np.ndarray', IDS: 'np.ndarray', NEXT_ID: int) -> 'AcquisitionsStore':
+        '''
+        Store from the rows in arrival order (type codes, values and row ids), vectorized
+        '''
+        import numpy as np
+        STORE = cls(TYPES)
+        N = len(CODES)
+        STORE._row_type = np.asarray(CODES, dtype=np.int32).copy()
+        STORE._row_id = np.asarray(IDS, dtype=np.int64).copy()
+        STORE._row_pos = np.empty(N, dtype=np.int64)
+        for CODE, TYPE in enumerate(STORE.types):
+            MASK = STORE._row_type == CODE
+            COUNT = int(MASK.sum())
+            STORE._values[CODE] = np.asarray(VALUES, dtype=np.float64)[MASK]
+            STORE._counts[CODE] = COUNT
+            STORE._row_pos[MASK] = np.arange(COUNT)
+            STORE.data[TYPE] = STORE._values[CODE].tolist()
+            STORE.stats[TYPE].add_many(STORE._values[CODE])
+        STORE.size = N
+        STORE.next_id = NEXT_ID
+        return STORE
+
+    def add(self, TYPE: str, VALUE: float) -> int:
+        '''
+        Append a value, return its row
+        '''
+        return self.extend(TYPE, [VALUE])
+
+    def extend(self, TYPE: str, VALUES) -> int:
+        '''
+        Append the values (list / array) of a type, return the first new row
+        '''
+        import numpy as np
+        VALUES = np.asarray(VALUES, dtype=np.float64).ravel()
+        CODE, N, ROW = self.type_code(TYPE), len(VALUES), self.size
+        COUNT = self._counts[CODE]
+        self._values[CODE] = _GROW(self._values[CODE], COUNT + N)
+        self._values[CODE][COUNT:COUNT + N] = VALUES
+        self._counts[CODE] = COUNT + N
+        self._row_type = _GROW(self._row_type, ROW + N)
+        self._row_pos = _GROW(self._row_pos, ROW + N)
+        self._row_id = _GROW(self._row_id, ROW + N)
+        self._row_type[ROW:ROW + N] = CODE
+        self._row_pos[ROW:ROW + N] = np.arange(COUNT, COUNT + N)
+        self._row_id[ROW:ROW + N] = np.arange(self.next_id, self.next_id + N)
+        self.size = ROW + N
+        self.next_id += N
+        self.data[TYPE].extend(VALUES.tolist())
+        self.stats[TYPE].add_many(VALUES)
+        if self.journal:
+            self.journal.add(CODE, VALUES)
+        return ROW
+
+    def extend_runs(self, TYPES: List[str], COUNTS: List[int], VALUES) -> int:
+        '''
+        Append runs of values of mixed types in arrival order, return the first new row
+
+        TYPES / COUNTS: type and number of values of each consecutive run of VALUES (vectorized, 1 journal write)
+        '''
+        import numpy as np
+        VALUES = np.asarray(VALUES, dtype=np.float64).ravel()
+        CODE_OF: Dict[str, int] = {TYPE: self.type_code(TYPE) for TYPE in dict.fromkeys(TYPES)}
+        CODES = np.fromiter(map(CODE_OF.__getitem__, TYPES), dtype=np.int32, count=len(TYPES))
+        N, ROW = len(VALUES), self.size
+        if len(CODES) != N: # runs of more than 1 value
+            CODES = np.repeat(CODES, COUNTS)
+        self._row_type = _GROW(self._row_type, ROW + N)
+        self._row_pos = _GROW(self._row_pos, ROW + N)
+        self._row_id = _GROW(self._row_id, ROW + N)
+        self._row_type[ROW:ROW + N] = CODES
+        self._row_id[ROW:ROW + N] = np.arange(self.next_id, self.next_id + N)
+        POSITIONS = self._row_pos[ROW:ROW + N]
+        for CODE in CODE_OF.values():
+            MASK = CODES == CODE
+            BLOCK = VALUES[MASK]
+            COUNT, K = self._counts[CODE], len(BLOCK)
+            self._values[CODE] = _GROW(self._values[CODE], COUNT + K)
+            self._values[CODE][COUNT:COUNT + K] = BLOCK
+            self._counts[CODE] = COUNT + K
+            POSITIONS[MASK] = np.arange(COUNT, COUNT + K)
+            self.data[self.types[CODE]].extend(BLOCK.tolist())
+            self.stats[self.types[CODE]].add_many(BLOCK)
+        self.size = ROW + N
+        self.next_id += N
+        if self.journal:
+            self.journal.add(CODES, VALUES)
+        return ROW
+
+    def remove(self, ROW: int) -> None:
+        '''
+        Delete a row (arrival order)
+        '''
+        CODE, POS, SIZE = int(self._row_type[ROW]), int(self._row_pos[ROW]), self.size
+        ROW_ID = int(self._row_id[ROW])
+        COUNT = self._counts[CODE]
+        self._values[CODE][POS:COUNT - 1] = self._values[CODE][POS + 1:COUNT]
+        self._counts[CODE] = COUNT - 1
+        self._row_type[ROW:SIZE - 1] = self._row_type[ROW + 1:SIZE]
+        self._row_pos[ROW:SIZE - 1] = self._row_pos[ROW + 1:SIZE]
+        self._row_id[ROW:SIZE - 1] = self._row_id[ROW + 1:SIZE]
+        self.size = SIZE - 1
+        TAIL = self._row_pos[ROW:self.size]
+        TAIL[self._row_type[ROW:self.size] == CODE] -= 1
+        del self.data[self.types[CODE]][POS]
+        self.stats[self.types[CODE]].recompute(self._values[CODE][:COUNT - 1])
+        if self.journal:
+            self.journal.remove(ROW_ID)
+
+    def set(self, ROW: int, VALUE: float) -> None:
+        '''
+        Change the value of a row (arrival order)
+        '''
+        CODE, POS = int(self._row_type[ROW]), int(self._row_pos[ROW])
+        VALUE = float(VALUE)
+        self._values[CODE][POS] = VALUE
+        self.data[self.types[CODE]][POS] = VALUE
+        self.stats[self.types[CODE]].recompute(self._values[CODE][:self._counts[CODE]])
+        if self.journal:
+            self.journal.set(int(self._row_id[ROW]), VALUE)
+
+    def row(self, ROW: int) -> Tuple[str, float]:
+        CODE = int(self._row_type[ROW])
+        return self.types[CODE], float(self._values[CODE][self._row_pos[ROW]])
+
+    def arrays(self) -> Dict[str, 'np.ndarray']:
+        '''
+        {type: float64 array} views of the store (no copy, valid until the next add / remove)
+        '''
+        return {TYPE: self._values[CODE][:self._counts[CODE]] for CODE, TYPE in enumerate(self.types)}
+
+    def dataframe(self) -> 'pd.DataFrame':
+        '''
+        DataFrame in arrival order: TYPE (categorical, codes over the store) / VALUE
+        '''
+        import numpy as np
+        import pandas as pd
+        CODES = self._row_type[:self.size]
+        VALUES = np.empty(self.size, dtype=np.float64)
+        for CODE in range(len(self.types)):
+            MASK = CODES == CODE
+            VALUES[MASK] = self._values[CODE][self._row_pos[:self.size][MASK]]
+        return pd.DataFrame({
+            "TYPE": pd.Categorical.from_codes(CODES, categories=self.types),
+            "VALUE": VALUES,
+        })
+
+class AcquisitionsJournal:
+    '''
+    Append-only journal of an AcquisitionsStore, for autosave and crash recovery
+
+    FILES:
+        - PATH: binary records of 17 bytes (op uint8, key int64, value float64, little endian)
+          after an 8 bytes header: ADD (key = type code, value) / DEL (key = row id) / SET (key = row id, new value)
+        - PATH.types: measurement type names, 1 JSON string per line (line = type code)
+
+    The records are buffered and synced to disk (flush + fsync) every SYNC_EVERY seconds
+    by the shared Scheduler, new types are synced immediately
+
+    ** load() rebuilds the store with NumPy (no replay of UI operations), a truncated last record is ignored
+    ** start() rewrites the journal with the current store (compacted, row ids renumbered)
+    ** close() detaches the journal from its store and cancels the scheduled sync
+    ** Version 1 journals (13 bytes records: int32 key, DEL row id in value) are loaded and rewritten as version 2
+    '''
+    MAGIC: bytes = b"EPSACQ2\n"
+    MAGIC_V1: bytes = b"EPSACQ1\n"
+    ADD: int = 1
+    DEL: int = 2
+    SET: int = 3
+
+    def __init__(self, PATH: str, SYNC_EVERY: float = 1.0):
+        self.path: str = PATH
+        self.sync_every: float = SYNC_EVERY
+        self._file = None
+        self._types = None
+        self._store: 'AcquisitionsStore' = None
+        self._dirty: bool = False
+        self._sync_call = None
+
+    @staticmethod
+    def _RECORD(VERSION: int = 2) -> 'np.dtype':
+        import numpy as np
+        return np.dtype([("op", "u1"), ("key", "<i8" if VERSION == 2 else "<i4"), ("value", "<f8")])
+
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def exists(self) -> bool:
+        '''
+        True if PATH is a journal with at least 1 record
+        '''
+        return os.path.isfile(self.path) and os.path.getsize(self.path) > len(self.MAGIC)
+
+    def start(self, STORE: 'AcquisitionsStore') -> None:
+        '''
+        New journal (PATH is overwritten) with the current rows of STORE, then attached to it
+        '''
+        import numpy as np
+        self.close()
+        STORE._row_id[:STORE.size] = np.arange(STORE.size)
+        STORE.next_id = STORE.size
+        RECORDS = np.empty(STORE.size, dtype=self._RECORD())
+        RECORDS["op"] = self.ADD
+        RECORDS["key"] = STORE._row_type[:STORE.size]
+        for CODE in range(len(STORE.types)):
+            MASK = RECORDS["key"] == CODE
+            RECORDS["value"][MASK] = STORE._values[CODE][STORE._row_pos[:STORE.size][MASK]]
+        with open(self.path + ".types", "w", encoding="utf-8") as file:
+            file.writelines(json.dumps(TYPE) + "\n" for TYPE in STORE.types)
+        with open(self.path, "wb") as file:
+            file.write(self.MAGIC)
+            file.write(RECORDS.tobytes())
+        self._open(STORE)
+
+    def load(self, TYPES: List[str] = None) -> 'AcquisitionsStore':
+        '''
+        Rebuild the store saved in the journal and attach the journal to it (TYPES: types registered first)
+
+        ** Missing PATH.types (crash between writes): the records of the unknown types are dropped
+           and the journal is rewritten (start), like a truncated journal
+        '''
+        import numpy as np
+        self.close()
+        JOURNAL_TYPES: List[str] = []
+        if os.path.isfile(self.path + ".types"):
+            with open(self.path + ".types", encoding="utf-8") as file:
+                JOURNAL_TYPES = [json.loads(line) for line in file if line.strip()]
+        with open(self.path, "rb") as file:
+            MAGIC = file.read(len(self.MAGIC))
+            if MAGIC not in (self.MAGIC, self.MAGIC_V1):
+                raise ValueError(f"NOT AN ACQUISITIONS JOURNAL: {self.path}")
+            RAW = file.read()
+        VERSION: int = 2 if MAGIC == self.MAGIC else 1
+        RECORD = self._RECORD(VERSION)
+        VALID = len(RAW) - len(RAW) % RECORD.itemsize
+        if VALID != len(RAW): # truncated last record (crash while writing)
+            with open(self.path, "r+b") as file:
+                file.truncate(len(self.MAGIC) + VALID)
+        RECORDS = np.frombuffer(RAW[:VALID], dtype=RECORD)
+        ADDS = RECORDS[RECORDS["op"] == self.ADD]
+        IDS = np.arange(len(ADDS))
+        DELETED = RECORDS[RECORDS["op"] == self.DEL]
+        DELETED = DELETED["key"] if VERSION == 2 else DELETED["value"].astype(np.int64)
+        KNOWN = (ADDS["key"] >= 0) & (ADDS["key"] < len(JOURNAL_TYPES))
+        KEEP = ~np.isin(IDS, DELETED) & KNOWN
+        VALUES = ADDS["value"].copy()
+        SETS = RECORDS[RECORDS["op"] == self.SET][::-1] # last SET of each row id wins
+        SET_IDS, LAST = np.unique(SETS["key"], return_index=True)
+        VALUES[SET_IDS] = SETS["value"][LAST]
+        STORE = AcquisitionsStore.from_arrays(JOURNAL_TYPES, ADDS["key"][KEEP], VALUES[KEEP], IDS[KEEP], len(ADDS))
+        if VERSION == 2 and KNOWN.all():
+            self._open(STORE)
+            for TYPE in TYPES or []:
+                STORE.type_code(TYPE)
+        else: # old format / lost types: rewritten, the codes of the dropped records aren't reused
+            for TYPE in TYPES or []:
+                STORE.type_code(TYPE)
+            self.start(STORE)
+        return STORE
+
+    def _open(self, STORE: 'AcquisitionsStore') -> None:
+        self._file = open(self.path, "ab")
+        self._types = open(self.path + ".types", "a", encoding="utf-8")
+        self._store = STORE
+        STORE.journal = self
+        self._sync_call = SCHEDULER_GET().call_every(self.sync_every, self.sync)
+
+    def add_type(self, TYPE: str) -> None:
+        self._types.write(json.dumps(TYPE) + "\n")
+        self._types.flush()
+        os.fsync(self._types.fileno())
+
+    def add(self, CODE: Union[int, 'np.ndarray'], VALUES: 'np.ndarray') -> None:
+        '''
+        ADD records of the values (CODE: type code of all the values, or array with the code of each value)
+        '''
+        if len(VALUES) == 1 and isinstance(CODE, int):
+            self._file.write(_JOURNAL_RECORD.pack(self.ADD, CODE, VALUES[0]))
+        else:
+            import numpy as np
+            RECORDS = np.empty(len(VALUES), dtype=self._RECORD())
+            RECORDS["op"] = self.ADD
+            RECORDS["key"] = CODE
+            RECORDS["value"] = VALUES
+            self._file.write(RECORDS.tobytes())
+        self._dirty = True
+
+    def remove(self, ROW_ID: int) -> None:
+        self._file.write(_JOURNAL_RECORD.pack(self.DEL, ROW_ID, 0.0))
+        self._dirty = True
+
+    def set(self, ROW_ID: int, VALUE: float) -> None:
+        self._file.write(_JOURNAL_RECORD.pack(self.SET, ROW_ID, VALUE))
+        self._dirty = True
+
+    def sync(self) -> None:
+        '''
+        Flush the buffered records to disk (fsync), does nothing if there are no new records
+        '''
+        if self._dirty and self._file:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._dirty = False
+
+    def close(self, DELETE: bool = False) -> None:
+        '''
+        Sync and close the journal files (DELETE: remove them, the session was saved)
+
+        ** The store isn't journaled anymore (start() attaches a journal again)
+        '''
+        if self._sync_call:
+            self._sync_call.cancel()
+            self._sync_call = None
+        if self._file:
+            self.sync()
+            self._file.close()
+            self._types.close()
+            self._file = self._types = None
+        if self._store is not None and self._store.journal is self:
+            self._store.journal = None
+        self._store = None
+        if DELETE:
+            for PATH in (self.path, self.path + ".types"):
+                if os.path.isfile(PATH):
+                    os.remove(PATH)
+
+_JOURNAL_RECORD = Struct("<Bqd")
+
+class AcquisitionsModel(QAbstractTableModel):
+    '''
+    Table model (TYPE / VALUE) over an AcquisitionsStore
+
+    ** VALUE cells are editable ("4.7", "4.7k"...), the edit updates the store (data, stats, journal);
+       an unparseable value is rejected
+    '''
+    HEADERS: Tuple[str] = ("TYPE", "VALUE")
+
+    def __init__(self, STORE: AcquisitionsStore, parent=None):
+        super().__init__(parent)
+        self.store = STORE
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.store.size
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section] if section < len(self.HEADERS) else None
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        return str(self.store.row(index.row())[index.column()])
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() != 1 or role != Qt.ItemDataRole.EditRole:
+            return False
+        VALUE = SI_PARSE_VALUE(value)
+        if VALUE is None:
+            return False
+        self.store.set(index.row(), VALUE)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.isValid() and index.column() == 1:
+            return FLAGS | Qt.ItemFlag.ItemIsEditable
+        return FLAGS
+
+    def add(self, TYPE: str, VALUES) -> None:
+        '''
+        Append values of a type to the store and the view
+        '''
+        N = len(VALUES)
+        if not N:
+            return
+        ROW = self.store.size
+        self.beginInsertRows(QModelIndex(), ROW, ROW + N - 1)
+        self.store.extend(TYPE, VALUES)
+        self.endInsertRows()
+
+    def add_runs(self, TYPES: List[str], COUNTS: List[int], VALUES) -> None:
+        '''
+        Append runs of values of mixed types (AcquisitionsStore.extend_runs) to the store and the view, 1 insert
+        '''
+        N = len(VALUES)
+        if not N:
+            return
+        ROW = self.store.size
+        self.beginInsertRows(QModelIndex(), ROW, ROW + N - 1)
+        self.store.extend_runs(TYPES, COUNTS, VALUES)
+        self.endInsertRows()
+
+    def remove(self, ROW: int) -> None:
+        self.beginRemoveRows(QModelIndex(), ROW, ROW)
+        self.store.remove(ROW)
+        self.endRemoveRows()
+
+    def reset(self, STORE: AcquisitionsStore) -> None:
+        self.beginResetModel()
+        self.store = STORE
+        self.endResetModel()
+
+class AcquisitionsStatsModel(QAbstractTableModel):
+    '''
+    Read-only table model of the running statistics (1 row per type) of an AcquisitionsModel store,
+    refreshed when the rows / values of the acquisitions model change
+    '''
+    HEADERS: Tuple[str] = ("COUNT", "MEAN", "STD", "MIN", "MAX", "LAST")
+
+    def __init__(self, MODEL: AcquisitionsModel, parent=None):
+        super().__init__(parent)
+        self.source = MODEL
+        MODEL.rowsInserted.connect(self.refresh)
+        MODEL.rowsRemoved.connect(self.refresh)
+        MODEL.dataChanged.connect(self.refresh)
+        MODEL.modelReset.connect(self.refresh)
+
+    def refresh(self, *args) -> None:
+        '''
+        Layout reset if the types changed, else dataChanged of the whole (small) table
+        '''
+        if self.rowCount() != getattr(self, "_rows", -1):
+            self.beginResetModel()
+            self._rows = self.rowCount()
+            self.endResetModel()
+        elif self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(self._rows - 1, len(self.HEADERS) - 1))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.source.store.types)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return super().headerData(section, orientation, role)
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section] if section < len(self.HEADERS) else None
+        TYPES = self.source.store.types
+        return TYPES[section] if section < len(TYPES) else None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        STATS: RunningStats = self.source.store.stats[self.source.store.types[index.row()]]
+        if index.column() == 0:
+            return str(STATS.count)
+        VALUE = (STATS.mean if STATS.count else float("nan"), STATS.std, STATS.min, STATS.max, STATS.last)[index.column() - 1]
+        return "" if VALUE != VALUE else f"{VALUE:.6g}"
+
 class QACQUISITIONS(QDialog):
     '''
     QAcquisitions Form
@@ -317,74 +1352,229 @@ class QACQUISITIONS(QDialog):
         - VALUES: Dict[str, List] -> example: {"MEASURE": [], "INDICATION": []}
         - info: str -> Text info about parameters of acquisitions
 
+    Blocks of values can be pasted in the table (Ctrl+V) or added with VALUES_PASTE, the unparseable
+    values are reported instead of added
+
+    Samples can be added from worker threads with PUSH / PUSH_MANY (thread-safe), the table
+    is updated on the GUI thread at most MAX_FPS times per second while the dialog is shown
+    (DRAIN adds the queued samples on demand)
+
+    The values are kept in an AcquisitionsStore (self.store) shown by the table (tbl_values is a QTableView,
+    read the values from self.data / self.store, not with CELL_RD). VALUE cells can be edited to fix a value:
+        - self.data: Dict[str, List[float]], copy of the values (GET_VALUES) updated on each add / edit / delete
+          and on close, not on each DRAIN
+        - self.store.arrays(): Dict[str, np.ndarray]
+        - self.store.dataframe(): pd.DataFrame
+        - self.store.stats: Dict[str, RunningStats], shown in the statistics panel (tbl_stats)
+
+    JOURNAL: path of an append-only autosave file, the session is recovered from it if it exists (JOURNAL_OPEN)
+
     `Warnings:`
         - LEFT/RIGHT functions are Not Enabled by default, its necessary to config in the MainWindow
     '''    
-    def __init__(self, VALUES: Dict[str, List] = None, info: str = str(), Window_Title: str="ACQUISITIONS", icon: QIcon = None):
+    def __init__(self, VALUES: Dict[str, List] = None, info: str = str(), Window_Title: str="ACQUISITIONS", icon: QIcon = None, MAX_FPS: int = 30, JOURNAL: str = None):
         QDialog.__init__(self)
         self.data: Dict[str, List] = None
+        self.journal: AcquisitionsJournal = None
+        self._queue: SimpleQueue = SimpleQueue() # PUSH / PUSH_MANY (any thread) -> DRAIN (GUI thread)
 
         ''' INIT '''
-        self.ui = PYSIDE_QACQUISITIONS.Ui_Dialog()
+        self.ui = _UI("PYSIDE_QACQUISITIONS").Ui_Dialog()
         self.ui.setupUi(self)
 
         ''' WIDGETS '''
-        self.setWindowIcon(QIcon(":/__forms/info.ico"))
+        self.setWindowIcon(_ICO_INFO())
         if icon: self.setWindowIcon(icon)
         self.setWindowTitle(Window_Title)
         self.ui.cb_units.clear()
         self.ui.cb_units.addItems(["G","M","k","","m","µ","n"])
         self.ui.cb_units.setCurrentIndex(3)
+        self.store = AcquisitionsStore()
+        self.model = AcquisitionsModel(self.store, self)
+        self.ui.tbl_values.setModel(self.model)
+        ## STATISTICS PANEL
+        self.stats_model = AcquisitionsStatsModel(self.model, self)
+        self.tbl_stats = QTableView(self)
+        self.tbl_stats.setObjectName("tbl_stats")
+        self.tbl_stats.setModel(self.stats_model)
+        self.tbl_stats.setFont(QFont('Consolas', 9))
+        self.tbl_stats.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.tbl_stats.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.tbl_stats.setMaximumHeight(110)
+        self.ui.verticalLayout.addWidget(self.tbl_stats)
 
         ## DATA
         self.SET_VALUES(info=info, values=VALUES)
-        self.GET_VALUES()
+        if JOURNAL:
+            self.JOURNAL_OPEN(JOURNAL)
 
         ''' CONNECTIONS '''
         self.ui.btn_addvalue.clicked.connect(self.VALUE_ADD)
         self.ui.btn_delete.clicked.connect(self.VALUE_DEL)
         self.ui.btn_exit.clicked.connect(self.close)
+        self.model.dataChanged.connect(lambda *args: self.GET_VALUES()) # VALUE cell edited
+        self._paste = QShortcut(QKeySequence.StandardKey.Paste, self.ui.tbl_values, self._CLIPBOARD_PASTE, context=Qt.ShortcutContext.WidgetWithChildrenShortcut)
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setInterval(max(1, int(1000 / MAX_FPS)))
+        self._drain_timer.timeout.connect(self.DRAIN)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        if self.journal and not self.journal.is_open(): # reopened after close
+            self.journal.start(self.store)
+        self._drain_timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        # accept / reject (Esc) hide the dialog without closeEvent
+        self.DRAIN()
+        self._drain_timer.stop()
+        self.GET_VALUES()
+        super().hideEvent(event)
 
     def closeEvent(self, event: QCloseEvent) -> None:
+        self.DRAIN()
+        self._drain_timer.stop()
+        self.GET_VALUES()
+        if self.journal:
+            self.journal.close()
+
+    def JOURNAL_OPEN(self, PATH: str) -> None:
+        '''
+        Autosave the acquisitions in an append-only journal (AcquisitionsJournal)
+
+        If PATH has a journal (crash / previous session) the session is recovered from it,
+        else a new journal is started with the current values
+
+        ** Remove the journal once the data is saved: self.journal.close(DELETE=True)
+        ** The journal is closed (files kept) with the form: closeEvent / destroyed
+        '''
+        if self.journal:
+            self.journal.close()
+        self.journal = AcquisitionsJournal(PATH)
+        # destroyed(QObject) would be taken as DELETE
+        self.destroyed.connect(lambda *args, JOURNAL=self.journal: JOURNAL.close())
+        if not self.journal.exists():
+            self.journal.start(self.store)
+            return
+        TYPES = [self.ui.cb_type.itemText(item) for item in range(self.ui.cb_type.count())]
+        self.store = self.journal.load([TYPE for TYPE in TYPES if TYPE != "-"])
+        self._TYPES_UPDATE()
+        self.model.reset(self.store)
         self.GET_VALUES()
 
+    def PUSH(self, TYPE: str, VALUE: float) -> None:
+        '''
+        Add a sample from any thread (instrument workers), thread-safe
+
+        The samples are queued and added to the table on the GUI thread by DRAIN,
+        at most MAX_FPS times per second (1 table update per frame, the samples
+        keep their order of arrival across types)
+        '''
+        self._queue.put((TYPE, VALUE, False))
+
+    def PUSH_MANY(self, TYPE: str, VALUES) -> None:
+        '''
+        Add a block of samples (list / NumPy array) of a type from any thread, thread-safe
+        '''
+        self._queue.put((TYPE, VALUES, True))
+
+    def DRAIN(self) -> int:
+        '''
+        Add the queued samples (PUSH / PUSH_MANY) to the store and the table, GUI thread only
+
+        `Returns:` int -> number of samples added
+        '''
+        TYPES: List[str] = [] # consecutive runs of samples of the same type, in order of arrival
+        COUNTS: List[int] = []
+        VALUES: list = []
+        LAST, COUNT = None, 0
+        get, append = self._queue.get_nowait, VALUES.append
+        while True:
+            try:
+                TYPE, SAMPLES, MANY = get()
+            except Empty:
+                break
+            if TYPE != LAST and COUNT:
+                TYPES.append(LAST)
+                COUNTS.append(COUNT)
+                COUNT = 0
+            LAST = TYPE
+            if MANY:
+                N = len(VALUES)
+                VALUES.extend(SAMPLES)
+                COUNT += len(VALUES) - N
+            else:
+                append(SAMPLES)
+                COUNT += 1
+        if COUNT:
+            TYPES.append(LAST)
+            COUNTS.append(COUNT)
+        if not VALUES:
+            return 0
+        if len(TYPES) == 1:
+            self.model.add(TYPES[0], VALUES)
+        else:
+            self.model.add_runs(TYPES, COUNTS, VALUES)
+        self._TYPES_UPDATE()
+        return len(VALUES)
+
+    def _TYPES_UPDATE(self) -> None:
+        # Types added to the store (PUSH of a new type, VALUES_PASTE, journal) are added to cb_type
+        TYPES = {self.ui.cb_type.itemText(item) for item in range(self.ui.cb_type.count())}
+        self.ui.cb_type.addItems([TYPE for TYPE in self.store.types if TYPE not in TYPES])
+
     def VALUE_ADD(self) -> None:
         '''
+        Add the value of tx_value ("4.7", "4.7k", "12µ"...), the cb_units prefix applies if the text has none
+
+        ** An unparseable value isn't added, the text is selected to be corrected
         '''
-        value: float = float()
-        try:
-            value = float(self.ui.tx_value.text())
-        except:
-            value = 0
-        unit: str = self.ui.cb_units.currentText()
-        match unit:
-            case "G":
-                value = value * 1e9
-            case "M":
-                value = value * 1e6
-            case "k":
-                value = value * 1e3
-            case "":
-                value = value * 1
-            case "m":
-                value = value * 1e-3
-            case "µ":
-                value = value * 1e-6
-            case "n":
-                value = value * 1e-9
-        row = self.ui.tbl_values.rowCount()
-        self.ui.tbl_values.insertRow(row)
-        CELL_WR(self.ui.tbl_values, row, 0, self.ui.cb_type.currentText())
-        CELL_WR(self.ui.tbl_values, row, 1, value)
+        value = SI_PARSE_VALUE(self.ui.tx_value.text(), self.ui.cb_units.currentText())
+        if value is None:
+            self.ui.tx_value.setFocus()
+            self.ui.tx_value.selectAll()
+            return
+        self.model.add(self.ui.cb_type.currentText(), [value])
         self.GET_VALUES()
 
+    def VALUES_PASTE(self, VALUES: Union[str, List[str]], TYPE: str = None) -> List[Tuple[int, str]]:
+        '''
+        Add a block of values (text separated by new lines / tabs / ";" or a list of texts) in 1 table update
+
+        The values are parsed with SI_PARSE (vectorized), the cb_units prefix applies to the values without prefix
+
+        VARIABLES:
+            - TYPE: measurement type, default the cb_type selection
+
+        `Returns:` List[(index, text)] -> unparseable values (not added)
+        '''
+        import numpy as np
+        if isinstance(VALUES, str):
+            VALUES = [value for value in re.split(r"[\t\r\n;]+", VALUES) if value.strip()]
+        VALUES = list(VALUES)
+        if not VALUES:
+            return []
+        NUMBERS, ERRORS = SI_PARSE(VALUES, self.ui.cb_units.currentText())
+        self.model.add(TYPE if TYPE is not None else self.ui.cb_type.currentText(), NUMBERS[~ERRORS])
+        self._TYPES_UPDATE()
+        self.GET_VALUES()
+        return [(int(index), VALUES[index]) for index in np.flatnonzero(ERRORS)]
+
+    def _CLIPBOARD_PASTE(self) -> None:
+        ERRORS = self.VALUES_PASTE(QApplication.clipboard().text())
+        if ERRORS:
+            INFOBOX(
+                f"{len(ERRORS)} VALUES NOT ADDED:\n\n" + "\n".join(f"{index + 1}: {text}" for index, text in ERRORS[:20]) + ("\n..." if len(ERRORS) > 20 else ""),
+                "PASTE", parent=self,
+            )
+
     def VALUE_DEL(self) -> None:
         '''
         '''
-        row = self.ui.tbl_values.currentRow()
+        row = self.ui.tbl_values.currentIndex().row()
         if row < 0:
             return
-        self.ui.tbl_values.removeRow(row)
+        self.model.remove(row)
         self.GET_VALUES()
     
     def EXIT(self) -> None:
@@ -399,32 +1589,24 @@ class QACQUISITIONS(QDialog):
         self.data = None
         self.ui.tx_value.clear()
         self.ui.cb_type.clear()
-        self.ui.tbl_values.setRowCount(0)
         if values:
             self.ui.cb_type.addItems(list(values.keys()))
-            for _type, _values in values.items():
-                for value in _values:
-                    row = self.ui.tbl_values.rowCount()
-                    self.ui.tbl_values.insertRow(row)
-                    CELL_WR(self.ui.tbl_values, row, 0, _type)
-                    CELL_WR(self.ui.tbl_values, row, 1, value)
         else:
             self.ui.cb_type.addItem("-")
+        self.store = AcquisitionsStore([self.ui.cb_type.itemText(item) for item in range(self.ui.cb_type.count())])
+        for _type, _values in (values or {}).items():
+            self.store.extend(_type, [_FLOAT(value) for value in _values])
+        self.model.reset(self.store)
+        if self.journal:
+            self.journal.start(self.store)
         self.ui.tx_value.setFocus()
         self.GET_VALUES()
 
     def GET_VALUES(self) -> None:
         '''
-        Add current acquisition to self.data like dict
+        Add current acquisition to self.data like dict (copy of the store lists, no table read)
         '''
-        self.data = dict()
-        for item in range(self.ui.cb_type.count()):
-            self.data[self.ui.cb_type.itemText(item)] = list()
-        for row in range(self.ui.tbl_values.rowCount()):
-            try:
-                self.data[CELL_RD(self.ui.tbl_values, row, 0)].append(float(CELL_RD(self.ui.tbl_values, row, 1)))
-            except:
-                self.data[CELL_RD(self.ui.tbl_values, row, 0)].append(0.0)
+        self.data = {TYPE: list(VALUES) for TYPE, VALUES in self.store.data.items()}
 
 class QTEXT_FORM(QDialog):
     def __init__(self, TEXT: str = None, info: str = str(), Window_Title: str="ACQUISITIONS", icon: QIcon = None):
@@ -432,11 +1614,11 @@ class QTEXT_FORM(QDialog):
         self.data: str = None
 
         ''' INIT '''
-        self.ui = PYSIDE_QTEXT_FORM.Ui_Dialog()
+        self.ui = _UI("PYSIDE_QTEXT_FORM").Ui_Dialog()
         self.ui.setupUi(self)
 
         ''' WIDGETS '''
-        self.setWindowIcon(QIcon(":/__forms/info.ico"))
+        self.setWindowIcon(_ICO_INFO())
         if icon: self.setWindowIcon(icon)
         self.setWindowTitle(Window_Title)
         # self.ui.btn_exit.clicked.connect(self.exitdialog)
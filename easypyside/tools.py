@@ -12,13 +12,22 @@ ________________________________________________________________________________
 
 ''' SYSTEM LIBRARIES '''
 import os
+import threading
 from enum import Enum, auto
+from heapq import heappop, heappush
+from itertools import count
+from math import ceil, floor, isfinite
+from time import monotonic, sleep
+from traceback import print_exc
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, TYPE_CHECKING
 
 ''' EXTERNAL LIBRARIES '''
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt, QEventLoop, QTimer, QDate, QTime, QUrl
-from PySide6.QtGui import QFont, QDesktopServices, QPalette, QColor
-from PySide6.QtTest import QTest # For delays
+from PySide6.QtCore import QSize, QResource, QObject, Signal
+from PySide6.QtGui import QFont, QDesktopServices, QPalette, QColor, QGuiApplication, QIcon, QPixmap
+if TYPE_CHECKING:
+    import numpy as np
 
 
 
@@ -28,17 +37,19 @@ from PySide6.QtTest import QTest # For delays
 def TIME_SLEEP(SEG: float=1):
     '''
     time.sleep function for use with PyQt 
+
+    ** Still spins a nested QEventLoop until the time is over: it's re-entrant, timers, signals / slots
+       and user events (clicks, close...) run inside the sleep, before TIME_SLEEP returns
+    ** Non blocking alternative (no nested loop): await SCHEDULER_GET().sleep(SEG) in a coroutine (Scheduler.sleep)
     '''
-    # time = float(SEG) * 1000
-    # try:
-    #     time = int(time)
-    # except:
-    #     time = 10
-    #     print(f"TIME_SLEEP ERROR / TIME (s): {SEG}")
-    # loop = QEventLoop()
-    # QTimer.singleShot(time, loop.quit)
-    # loop.exec()
-    QTest.qWait(int(SEG * 1000))
+    try:
+        time = int(float(SEG) * 1000)
+    except (TypeError, ValueError):
+        time = 10
+        print(f"TIME_SLEEP ERROR / TIME (s): {SEG}")
+    loop = QEventLoop()
+    QTimer.singleShot(time, loop.quit)
+    loop.exec()
 
 def DATE_STR_CONVERTER(DATE: str = "2023-01-01") -> QDate:
     '''
@@ -92,6 +103,49 @@ def TIME_STR_CONVERTER(TIME: str = "00:00") -> QTime | None:
     except:
         return None
 
+SI_PREFIXES: Dict[str, float] = {
+    "T": 1e12, "G": 1e9, "M": 1e6, "k": 1e3, "": 1.0,
+    "m": 1e-3, "µ": 1e-6, "μ": 1e-6, "u": 1e-6, "n": 1e-9, "p": 1e-12,
+}
+def SI_PARSE_VALUE(TEXT: str, UNIT: str = "") -> float | None:
+    '''
+    Parse 1 number with optional SI prefix (same rules as SI_PARSE, without Pandas)
+
+    `Returns:` float, None if the text isn't a finite number
+    '''
+    TEXT = str(TEXT).strip()
+    SCALE = SI_PREFIXES.get(UNIT)
+    if TEXT and TEXT[-1] in SI_PREFIXES:
+        TEXT, SCALE = TEXT[:-1].rstrip(), SI_PREFIXES[TEXT[-1]]
+    if "_" in TEXT: # float() accepts "1_000", Pandas doesn't
+        return None
+    try:
+        VALUE = float(TEXT) * SCALE
+    except (TypeError, ValueError):
+        return None
+    return VALUE if isfinite(VALUE) else None
+
+def SI_PARSE(VALUES: Iterable[str], UNIT: str = "") -> Tuple['np.ndarray', 'np.ndarray']:
+    '''
+    Parse numbers with optional SI prefix ("4.7k", "12µ", "-3e-2 m", "100") in one vectorized pass (Pandas)
+
+    VARIABLES:
+        - UNIT: default prefix for the values without their own prefix (G / M / k / "" / m / µ / n ...)
+
+    `Returns:` (values, errors) -> float64 array (NaN if error), bool array (True = unparseable / not finite value)
+    '''
+    import numpy as np
+    import pandas as pd
+    TEXT = pd.Series(list(VALUES), dtype=object).astype(str).str.strip()
+    LAST = TEXT.str[-1]
+    PREFIXED = LAST.isin([prefix for prefix in SI_PREFIXES if prefix])
+    NUMBERS = pd.to_numeric(TEXT.where(~PREFIXED, TEXT.str[:-1].str.rstrip()), errors="coerce")
+    SCALE = LAST.where(PREFIXED, UNIT).map(SI_PREFIXES)
+    VALUES = NUMBERS.to_numpy(dtype=np.float64, na_value=np.nan) * SCALE.to_numpy(dtype=np.float64, na_value=np.nan)
+    ERRORS = ~np.isfinite(VALUES) # also "nan" / "inf" texts
+    VALUES[ERRORS] = np.nan
+    return VALUES, ERRORS
+
 def PATH_OPEN(path: str = os.getcwd()):
     '''
     Open the selected path using the QDesktopServices
@@ -107,6 +161,314 @@ class MYFONTS(Enum):
     FONT_TABLE = QFont("Consolas", pointSize=10)
 
 
+# SCHEDULER
+# ________________________________________________________________________________________________ '''
+
+class ScheduledCall:
+    '''
+    Handle of a callback scheduled in a Scheduler (call_at / call_later / call_every)
+    '''
+    __slots__ = ("deadline", "interval", "callback", "args", "cancelled")
+
+    def __init__(self, DEADLINE: float, INTERVAL: float, CALLBACK: Callable, ARGS: tuple):
+        self.deadline: float = DEADLINE
+        self.interval: float = INTERVAL
+        self.callback: Callable = CALLBACK
+        self.args: tuple = ARGS
+        self.cancelled: bool = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+class Scheduler(QObject):
+    '''
+    Cooperative scheduler: one-shot / deadline / periodic callbacks and awaitable sleeps
+    on a single shared QTimer (armed for the next deadline of a heap)
+
+    ** Callbacks never run reentrantly: if a callback runs a nested event loop (exec, TIME_SLEEP),
+       the due callbacks wait until it returns
+    ** Callbacks scheduled while the due ones are running go to the next timer shot
+    ** Periodic calls keep their phase, missed periods (busy GUI) are skipped, not accumulated
+    ** Times in seconds (time.monotonic)
+    '''
+    def __init__(self, parent: QObject = None):
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._run)
+        self._queue: List[tuple] = [] # heap: (deadline, sequence, ScheduledCall)
+        self._sequence = count()
+        self._running: bool = False
+
+    def call_at(self, DEADLINE: float, CALLBACK: Callable, *args) -> ScheduledCall:
+        '''
+        Run CALLBACK(*args) once at DEADLINE (time.monotonic)
+        '''
+        return self._push(ScheduledCall(DEADLINE, 0, CALLBACK, args))
+
+    def call_later(self, DELAY: float, CALLBACK: Callable, *args) -> ScheduledCall:
+        '''
+        Run CALLBACK(*args) once after DELAY seconds
+        '''
+        return self.call_at(monotonic() + DELAY, CALLBACK, *args)
+
+    def call_every(self, INTERVAL: float, CALLBACK: Callable, *args, DELAY: float = None) -> ScheduledCall:
+        '''
+        Run CALLBACK(*args) every INTERVAL seconds (first call after DELAY, default INTERVAL) until cancel()
+        '''
+        if INTERVAL <= 0:
+            raise ValueError(f"Scheduler.call_every INTERVAL must be > 0: {INTERVAL}")
+        return self._push(ScheduledCall(monotonic() + (INTERVAL if DELAY is None else DELAY), INTERVAL, CALLBACK, args))
+
+    async def sleep(self, SEG: float) -> None:
+        '''
+        Awaitable delay for coroutines running in an asyncio event loop that processes the Qt events
+        (QtAsyncio or a plain asyncio loop calling QApplication.processEvents, see README)
+
+        ** Example: await SCHEDULER_GET().sleep(0.5)
+        '''
+        import asyncio
+        future = asyncio.get_running_loop().create_future()
+        CALL = self.call_later(SEG, lambda: future.done() or future.set_result(None))
+        try:
+            await future
+        finally:
+            CALL.cancel()
+
+    def pending(self) -> int:
+        '''
+        Number of scheduled (not cancelled) calls
+        '''
+        return sum(not call.cancelled for _, _, call in self._queue)
+
+    def _push(self, CALL: ScheduledCall) -> ScheduledCall:
+        heappush(self._queue, (CALL.deadline, next(self._sequence), CALL))
+        self._arm()
+        return CALL
+
+    def _arm(self) -> None:
+        if self._running:
+            return # armed when the due callbacks end
+        while self._queue and self._queue[0][2].cancelled:
+            heappop(self._queue)
+        if not self._queue:
+            self._timer.stop()
+            return
+        DELAY = max(0.0, self._queue[0][0] - monotonic())
+        self._timer.start(ceil(DELAY * 1000))
+
+    def _run(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        try:
+            NOW = monotonic()
+            DUE: List[ScheduledCall] = []
+            while self._queue and self._queue[0][0] <= NOW:
+                CALL = heappop(self._queue)[2]
+                if CALL.cancelled:
+                    continue
+                DUE.append(CALL)
+                if CALL.interval:
+                    MISSED = floor((NOW - CALL.deadline) / CALL.interval) + 1
+                    CALL.deadline += MISSED * CALL.interval
+                    heappush(self._queue, (CALL.deadline, next(self._sequence), CALL))
+            for CALL in DUE:
+                if CALL.cancelled: # cancelled by a previous callback
+                    continue
+                try:
+                    CALL.callback(*CALL.args)
+                except Exception:
+                    print_exc()
+                if not CALL.interval:
+                    CALL.cancelled = True
+        finally:
+            self._running = False
+            self._arm()
+
+_SCHEDULER: List[Scheduler] = []
+
+def SCHEDULER_GET() -> Scheduler:
+    '''
+    Shared Scheduler of the process (created on first use)
+    '''
+    if not _SCHEDULER:
+        _SCHEDULER.append(Scheduler())
+    return _SCHEDULER[0]
+
+
+# SEARCH
+# ________________________________________________________________________________________________ '''
+
+class PrefixIndex:
+    '''
+    Sorted prefix index (case insensitive) of a list of strings
+
+    The keys (casefold) are sorted once (argsort), then the items that start with a prefix are a
+    contiguous range of the sorted order found with 2 binary searches.
+    Typing narrows the search: the range of "ab" is searched inside the range of "a".
+
+    ** Build it in a worker thread (PrefixIndexWorker): the Python steps run in chunks of CHUNK
+       items and release the GIL between chunks, so the GUI thread keeps running
+    ** Memory: the keys (sized to the longest key) and the sort order, no sorted copy of the keys
+    ** Keys are truncated to KEY_LENGTH chars (memory), longer prefixes are checked on the range
+    '''
+    KEY_LENGTH: int = 64
+
+    def __init__(self, ITEMS: Sequence[str], CHUNK: int = 20_000):
+        import numpy as np
+        self.size: int = len(ITEMS)
+        self.items: 'np.ndarray' = np.empty(self.size, dtype=object)
+        KEYS: List[str] = []
+        for start in range(0, self.size, CHUNK):
+            CHUNK_ITEMS = [str(item) for item in ITEMS[start:start + CHUNK]]
+            self.items[start:start + CHUNK] = CHUNK_ITEMS
+            KEYS.extend(map(str.casefold, CHUNK_ITEMS))
+            sleep(0) # release the GIL between chunks
+        LENGTH: int = min(max(map(len, KEYS), default=1), self.KEY_LENGTH) or 1
+        ARRAY = np.empty(self.size, dtype=f"U{LENGTH}")
+        for start in range(0, self.size, CHUNK):
+            ARRAY[start:start + CHUNK] = KEYS[start:start + CHUNK]
+            sleep(0)
+        del KEYS
+        self.keys: 'np.ndarray' = ARRAY # item row -> key
+        self.order: 'np.ndarray' = np.argsort(ARRAY, kind="stable") # sorted position -> item row
+
+    def _search(self, KEY: str, LO: int, HI: int) -> int:
+        # First sorted position in [LO, HI) with a key >= KEY
+        while LO < HI:
+            MID = (LO + HI) // 2
+            if self.keys[self.order[MID]] < KEY:
+                LO = MID + 1
+            else:
+                HI = MID
+        return LO
+
+    def range(self, PREFIX: str, LO: int = 0, HI: int = None) -> Tuple[int, int]:
+        '''
+        Range [lo, hi) of the sorted keys that start with PREFIX, searched inside [LO, HI)
+        '''
+        HI = self.size if HI is None else HI
+        KEY: str = PREFIX.casefold()[:self.KEY_LENGTH]
+        if not KEY:
+            return LO, HI
+        START = self._search(KEY, LO, HI)
+        return START, self._search(KEY + "\U0010ffff", START, HI)
+
+    def rows(self, PREFIX: str, LO: int = 0, HI: int = None) -> 'np.ndarray':
+        '''
+        Rows of the items that start with PREFIX (in the original order), searched inside the range [LO, HI)
+        '''
+        import numpy as np
+        LO, HI = self.range(PREFIX, LO, HI)
+        ROWS = np.sort(self.order[LO:HI])
+        KEY: str = PREFIX.casefold()
+        if len(KEY) > self.KEY_LENGTH:
+            ROWS = ROWS[[item.casefold().startswith(KEY) for item in self.items[ROWS]]]
+        return ROWS
+
+class PrefixIndexWorker(QObject):
+    '''
+    Build a PrefixIndex in a worker thread
+
+    Signal : ready(PrefixIndex), received in the thread of the worker object (GUI)
+
+    ** Don't give it a parent: the worker keeps running if its user is closed before the index is ready
+    '''
+    ready = Signal(object)
+
+    def __init__(self, ITEMS: Sequence[str]):
+        super().__init__()
+        self._thread = threading.Thread(target=self._run, args=(ITEMS,), daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def _run(self, ITEMS: Sequence[str]) -> None:
+        self.ready.emit(PrefixIndex(ITEMS))
+
+
+# RESOURCES
+# ________________________________________________________________________________________________ '''
+
+RCC_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources.rcc")
+_RESOURCES: Dict[str, str] = {} # registered resources: {"easypyside": source}
+
+def RESOURCES_INIT(RCC: str = None) -> str:
+    '''
+    Register the easypyside Qt resources (":/__forms/...") on first use, later calls do nothing
+
+    VARIABLES:
+        - RCC: binary .rcc file (pyside6-rcc --binary), default easypyside/resources.rcc
+
+    The binary .rcc is registered with QResource.registerResource (memory-mapped by Qt),
+    if it can't be registered the embedded easypyside.resources module is imported instead
+
+    `Returns:` str -> source of the registered resources (.rcc path or module name)
+    '''
+    if "easypyside" in _RESOURCES:
+        return _RESOURCES["easypyside"]
+    RCC = RCC or RCC_PATH
+    if os.path.isfile(RCC) and QResource.registerResource(RCC):
+        _RESOURCES["easypyside"] = RCC
+    else:
+        import easypyside.resources # Embedded resources (qInitResources at import)
+        _RESOURCES["easypyside"] = "easypyside.resources"
+    return _RESOURCES["easypyside"]
+
+
+# ICONS
+# ________________________________________________________________________________________________ '''
+
+_ICONS: Dict[Tuple[str, float], QIcon] = {}
+_PIXMAPS: Dict[Tuple[str, int, float], QPixmap] = {}
+
+def _DEVICE_PIXEL_RATIO() -> float:
+    APP = QGuiApplication.instance()
+    return APP.devicePixelRatio() if APP else 1.0
+
+def ICON_GET(PATH: str) -> QIcon:
+    '''
+    Shared QIcon of a file / resource path (":/...")
+
+    The icon is created once per (PATH, device pixel ratio) and reused for the whole process,
+    so the image is decoded only the first time it's painted, not once per dialog
+
+    ** The returned QIcon is shared, don't modify it (addFile / addPixmap), create a new one instead
+    '''
+    KEY = (PATH, _DEVICE_PIXEL_RATIO())
+    ICON = _ICONS.get(KEY)
+    if ICON is None:
+        ICON = _ICONS[KEY] = QIcon(PATH)
+    return ICON
+
+def PIXMAP_GET(PATH: str, SIZE: int = None) -> QPixmap:
+    '''
+    Shared QPixmap of a file / resource path (":/...")
+
+    VARIABLES:
+        - SIZE: square size (logical pixels) of the pixmap taken from the icon, None = original image
+    '''
+    DPR = _DEVICE_PIXEL_RATIO()
+    KEY = (PATH, SIZE, DPR)
+    PIXMAP = _PIXMAPS.get(KEY)
+    if PIXMAP is None:
+        if SIZE:
+            PIXMAP = ICON_GET(PATH).pixmap(QSize(SIZE, SIZE), DPR)
+        else:
+            PIXMAP = QPixmap(PATH)
+        _PIXMAPS[KEY] = PIXMAP
+    return PIXMAP
+
+def ICON_CACHE_CLEAR() -> None:
+    '''
+    Release the shared icons and pixmaps (ICON_GET / PIXMAP_GET)
+    '''
+    _ICONS.clear()
+    _PIXMAPS.clear()
+
+
 # STYLE
 # ________________________________________________________________________________________________ '''
 
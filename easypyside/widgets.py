@@ -14,20 +14,25 @@ __author__ = 'PABLO GONZALEZ PILA <pablogonzalezpila@gmail.com>'
 __update__ = '2025.10.28'
 
 ''' SYSTEM LIBRARIES '''
+import csv
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum, auto
 # from re import match
-from typing import Any, List, Tuple, Union, TYPE_CHECKING
+from io import StringIO
+from itertools import islice
+from typing import Any, Iterable, List, Tuple, Union, TYPE_CHECKING
 # from unittest import case
 
 ''' EXTERNAL LIBRARIES '''
-from PySide6.QtCore import QDate, QTime, Qt, Signal
-from PySide6.QtGui import QFont, QColor
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QHeaderView
+from PySide6.QtCore import QDate, QTime, Qt, Signal, QAbstractTableModel, QModelIndex, QEvent, QObject, QTimer, QElapsedTimer
+from PySide6.QtGui import QFont, QColor, QKeySequence, QShortcut
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QHeaderView, QApplication, QStyle, QStyleOptionViewItem, QStyledItemDelegate, QAbstractItemView
 from PySide6.QtWidgets import QLineEdit, QTextEdit, QComboBox, QSpinBox, QDoubleSpinBox, QCheckBox, QDateEdit, QTimeEdit, QPushButton, QPlainTextEdit
-from PySide6.QtWidgets import QTableWidget, QTableWidgetItem
-# if TYPE_CHECKING:
-import pandas as pd
+from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QTableView
+if TYPE_CHECKING: # Lazy: imported inside the functions that use them (see __getattr__)
+    import numpy as np
+    import pandas as pd
 
 ''' INTERNAL LIBRARIES '''
 from .tools import DATE_QDATE_CONVERTER, DATE_STR_CONVERTER, TIME_STR_CONVERTER
@@ -37,6 +42,18 @@ from .tools import DATE_QDATE_CONVERTER, DATE_STR_CONVERTER, TIME_STR_CONVERTER
 ''' CONTENT
 ________________________________________________________________________________________________ '''
 
+def __getattr__(name: str):
+    '''
+    PEP 562: NumPy / Pandas are only imported when a function needs them (widgets.np / widgets.pd still available)
+    '''
+    if name == "np":
+        import numpy
+        return numpy
+    if name == "pd":
+        import pandas
+        return pandas
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 class CheckBoxCell(QWidget):
     '''
     Customized QCheckBox with center layout inside cell 
@@ -88,6 +105,302 @@ class CheckBoxCell(QWidget):
     #         # 🔹 Emitir señal extendida
     #         self.cellStateChanged.emit(self.row, self.column, self.isChecked())
 
+class CheckBoxDelegate(QStyledItemDelegate):
+    '''
+    Item delegate that paints and toggles a centered check box inside the "checkable" cells
+
+    Replaces one CheckBoxCell widget per cell, the check state lives in the item (Qt.CheckStateRole)
+    and the cell becomes the current cell on toggle (like CheckBoxCell)
+
+    ** Cells without Qt.UserRole == "checkable" are painted by QStyledItemDelegate
+    '''
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        if index.data(Qt.ItemDataRole.UserRole) != "checkable":
+            return super().paint(painter, option, index)
+        OPTION = QStyleOptionViewItem(option)
+        self.initStyleOption(OPTION, index)
+        STYLE = OPTION.widget.style() if OPTION.widget else QApplication.style()
+        CHECK_RECT = self._check_rect(OPTION, STYLE)
+        ## BACKGROUND (selection, alternate colors) without the default check indicator
+        OPTION.features &= ~QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+        OPTION.text = ""
+        STYLE.drawControl(QStyle.ControlElement.CE_ItemViewItem, OPTION, painter, OPTION.widget)
+        ## CHECK INDICATOR
+        OPTION.rect = CHECK_RECT
+        OPTION.state &= ~(QStyle.StateFlag.State_On | QStyle.StateFlag.State_Off | QStyle.StateFlag.State_NoChange)
+        if _CHECK_STATE(index) == Qt.CheckState.Checked:
+            OPTION.state |= QStyle.StateFlag.State_On
+        else:
+            OPTION.state |= QStyle.StateFlag.State_Off
+        if not index.flags() & Qt.ItemFlag.ItemIsUserCheckable:
+            OPTION.state &= ~QStyle.StateFlag.State_Enabled
+        STYLE.drawPrimitive(QStyle.PrimitiveElement.PE_IndicatorItemViewItemCheck, OPTION, painter, OPTION.widget)
+
+    def editorEvent(self, event: QEvent, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if index.data(Qt.ItemDataRole.UserRole) != "checkable":
+            return super().editorEvent(event, model, option, index)
+        FLAGS = index.flags()
+        if not (FLAGS & Qt.ItemFlag.ItemIsUserCheckable and FLAGS & Qt.ItemFlag.ItemIsEnabled):
+            return False
+        match event.type():
+            case QEvent.Type.MouseButtonRelease:
+                if not self._on_indicator(event, option, index):
+                    return False
+            case QEvent.Type.MouseButtonPress | QEvent.Type.MouseButtonDblClick:
+                # Consumed on the indicator only (no double toggle), elsewhere the cell is selected as usual
+                return self._on_indicator(event, option, index)
+            case QEvent.Type.KeyPress:
+                if event.key() not in (Qt.Key.Key_Space, Qt.Key.Key_Select):
+                    return False
+            case _:
+                return False
+        ## TOGGLE
+        STATE = Qt.CheckState.Unchecked if _CHECK_STATE(index) == Qt.CheckState.Checked else Qt.CheckState.Checked
+        RESULT = model.setData(index, STATE.value, Qt.ItemDataRole.CheckStateRole)
+        VIEW = self.parent()
+        if RESULT and isinstance(VIEW, QAbstractItemView):
+            VIEW.setCurrentIndex(index)
+        return RESULT
+
+    def _on_indicator(self, event: QEvent, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        '''
+        True if the event is a left click inside the check indicator of the cell
+        '''
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+        OPTION = QStyleOptionViewItem(option)
+        self.initStyleOption(OPTION, index)
+        STYLE = OPTION.widget.style() if OPTION.widget else QApplication.style()
+        return self._check_rect(OPTION, STYLE).contains(event.position().toPoint())
+
+    @staticmethod
+    def _check_rect(option: QStyleOptionViewItem, style: QStyle):
+        OPTION = QStyleOptionViewItem(option)
+        OPTION.features |= QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+        SIZE = style.subElementRect(QStyle.SubElement.SE_ItemViewItemCheckIndicator, OPTION, option.widget).size()
+        return QStyle.alignedRect(option.direction, Qt.AlignmentFlag.AlignCenter, SIZE, option.rect)
+
+def _CHECK_STATE(index: QModelIndex) -> Qt.CheckState:
+    '''
+    Check state of a model index as Qt.CheckState (the model can return int or Qt.CheckState)
+    '''
+    STATE = index.data(Qt.ItemDataRole.CheckStateRole)
+    return Qt.CheckState(STATE) if STATE is not None else Qt.CheckState.Unchecked
+
+def _CHECKBOX_DELEGATE(TABLE: QAbstractItemView) -> None:
+    '''
+    Install the CheckBoxDelegate in the view if it still uses the default delegate
+    '''
+    if type(TABLE.itemDelegate()) is QStyledItemDelegate:
+        TABLE.setItemDelegate(CheckBoxDelegate(TABLE))
+
+def _CHECKED(VALUE: Any) -> bool:
+    '''
+    Normalize a value to the check state of a QCheckBox / checkable cell
+    '''
+    if isinstance(VALUE, str):
+        truthy = {"1", "true", "yes", "on", "t", "y"}
+        return VALUE.lower() in truthy
+    if isinstance(VALUE, bool) or getattr(VALUE, "dtype", None) == bool:
+        return bool(VALUE)
+    return False
+
+class PandasTableModel(QAbstractTableModel):
+    '''
+    QAbstractTableModel over the columns of a Pandas DataFrame
+
+    Values are read from the column arrays only when the view asks for them,
+    so the cost depends on the visible rows and not on the table size.
+
+    ** bool columns are shown as checkable cells
+    ** PROTECTED_COLUMNS (int index or str name) are shown as non-editable cells
+    ** Cells are edited as text and parsed back with the column type (int / float columns keep their precision)
+    '''
+    def __init__(self, DATAFRAME: 'pd.DataFrame', PROTECTED_COLUMNS: list = [], parent=None):
+        import pandas as pd
+        super().__init__(parent)
+        self.dataframe: 'pd.DataFrame' = DATAFRAME.copy()
+        self.headers: List[str] = [str(col) for col in self.dataframe.columns]
+        self.protected: set = _TBL_COLUMNS_INDEX(self.dataframe.columns.to_list(), PROTECTED_COLUMNS)
+        self._bools: List[bool] = [dtype == bool for dtype in self.dataframe.dtypes]
+        self._kinds: List[str] = [dtype.kind for dtype in self.dataframe.dtypes]
+        self._arrays: list = [self._column(col) for col in range(len(self.headers))]
+        self._isnull = pd.isnull
+        self._na = pd.NA
+
+    def _column(self, COLUMN: int) -> Any:
+        '''
+        Values of COLUMN: numpy array, or the pandas array for extension dtypes (Int64 with NA isn't upcast to float)
+        '''
+        import numpy as np
+        SERIES = self.dataframe.iloc[:, COLUMN]
+        return SERIES.to_numpy() if isinstance(SERIES.dtype, np.dtype) else SERIES.array
+
+    def _parse(self, COLUMN: int, VALUE: Any) -> Any:
+        '''
+        Edited text to the type of COLUMN (the editor works on text, so floats keep all their decimals)
+        '''
+        if not isinstance(VALUE, str):
+            return VALUE
+        KIND: str = self._kinds[COLUMN]
+        if KIND not in "iuf":
+            return VALUE
+        VALUE = VALUE.strip()
+        if not VALUE:
+            return self._na
+        return float(VALUE) if KIND == "f" else int(VALUE)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.dataframe.index)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.headers[section] if section < len(self.headers) else None
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        VALUE = self._arrays[index.column()][index.row()]
+        if self._bools[index.column()]:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if VALUE else Qt.CheckState.Unchecked
+            if role == Qt.ItemDataRole.UserRole:
+                return "checkable"
+            return None
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole) or self._isnull(VALUE):
+            return None
+        return str(VALUE)
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() in self.protected:
+            return False
+        ROW, COLUMN = index.row(), index.column()
+        if self._bools[COLUMN]:
+            if role != Qt.ItemDataRole.CheckStateRole:
+                return False
+            value = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif role != Qt.ItemDataRole.EditRole:
+            return False
+        try:
+            self.dataframe.iat[ROW, COLUMN] = self._parse(COLUMN, value)
+        except (TypeError, ValueError):
+            return False
+        self._arrays[COLUMN] = self._column(COLUMN)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if not index.isValid() or index.column() in self.protected:
+            return FLAGS
+        if self._bools[index.column()]:
+            return FLAGS | Qt.ItemFlag.ItemIsUserCheckable
+        return FLAGS | Qt.ItemFlag.ItemIsEditable
+
+class IteratorTableModel(QAbstractTableModel):
+    '''
+    Read-only QAbstractTableModel that loads the rows of an iterator on demand (canFetchMore / fetchMore)
+
+    `ROWS:`
+        - DB-API cursor (fetchmany, headers from cursor.description)
+        - Iterator / generator of dicts (headers from the keys of the first row)
+        - Iterator of sequences, like csv.reader (HEADERS=True: the first row is the header)
+
+    ** The view asks for the next BATCH rows when it is scrolled to the end
+    '''
+    def __init__(self, ROWS: Iterable, HEADERS: Union[List[str], bool, None] = None, BATCH: int = 256, parent=None):
+        super().__init__(parent)
+        self.batch: int = BATCH
+        self.rows: List[tuple] = []
+        self._exhausted: bool = False
+        if hasattr(ROWS, "fetchmany") and hasattr(ROWS, "description"): # DB-API cursor
+            self._cursor = ROWS
+            self._iterator = None
+            if not HEADERS and ROWS.description:
+                HEADERS = [column[0] for column in ROWS.description]
+        else:
+            self._cursor = None
+            self._iterator = iter(ROWS)
+            if HEADERS is True:
+                HEADERS = [str(name) for name in next(self._iterator, [])]
+        self._keys: list = None
+        FIRST: list = self._fetch()
+        if FIRST and isinstance(FIRST[0], dict):
+            self._keys = list(HEADERS) if HEADERS else list(FIRST[0].keys())
+            FIRST = [tuple(row.get(key) for key in self._keys) for row in FIRST]
+            HEADERS = self._keys
+        if not HEADERS:
+            HEADERS = [str(column) for column in range(max((len(row) for row in FIRST), default=0))]
+        self.headers: List[str] = [str(name) for name in HEADERS]
+        self.rows.extend(tuple(row) for row in FIRST)
+
+    def _fetch(self) -> list:
+        if self._exhausted:
+            return []
+        if self._cursor is not None:
+            ROWS = list(self._cursor.fetchmany(self.batch))
+        else:
+            ROWS = list(islice(self._iterator, self.batch))
+        if len(ROWS) < self.batch:
+            self._exhausted = True
+        return ROWS
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        ROWS = self._fetch()
+        if not ROWS:
+            return
+        if self._keys is not None:
+            ROWS = [tuple(row.get(key) for key in self._keys) for row in ROWS]
+        START = len(self.rows)
+        self.beginInsertRows(QModelIndex(), START, START + len(ROWS) - 1)
+        self.rows.extend(tuple(row) for row in ROWS)
+        self.endInsertRows()
+
+    def fetchAll(self) -> None:
+        '''
+        Load all the remaining rows of the iterator
+        '''
+        while self.canFetchMore():
+            self.fetchMore()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.headers[section] if section < len(self.headers) else None
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        ROW = self.rows[index.row()]
+        VALUE = ROW[index.column()] if index.column() < len(ROW) else None
+        if isinstance(VALUE, bool):
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if VALUE else Qt.CheckState.Unchecked
+            if role == Qt.ItemDataRole.UserRole:
+                return "checkable"
+            return None
+        if role != Qt.ItemDataRole.DisplayRole or VALUE is None:
+            return None
+        return str(VALUE)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
 
 
 def WIDGET_WR(WIDGET: QWidget, VALUE: Any) -> None:
@@ -102,6 +415,7 @@ def WIDGET_WR(WIDGET: QWidget, VALUE: Any) -> None:
         - QDateEdit <str: "yyyy-mm-dd"> / QTimeEdit <str: "hh:mm">
         - QPushButton
         - QWidget (Layout) <QCheckBox>
+        - QTableWidgetItem (CELL_CHECKITEM)
     '''
     match WIDGET:
         case QLineEdit() | QTextEdit():
@@ -124,17 +438,12 @@ def WIDGET_WR(WIDGET: QWidget, VALUE: Any) -> None:
             else:
                 WIDGET.setValue(float(VALUE))
         case QCheckBox() | CheckBoxCell():
-            if isinstance(VALUE, bool):
-                WIDGET.setChecked(VALUE)
-            elif isinstance(VALUE, str):
-                truthy = {"1", "true", "yes", "on", "t", "y"}
-                if VALUE.lower() in truthy:
-                    isChecked: bool = True
-                else:
-                    isChecked: bool = False
-                WIDGET.setChecked(isChecked)
-            else: 
-                WIDGET.setChecked(False)
+            WIDGET.setChecked(_CHECKED(VALUE))
+        case QTableWidgetItem(): # CELL_CHECKITEM
+            if WIDGET.data(Qt.ItemDataRole.UserRole) == "checkable":
+                WIDGET.setCheckState(Qt.CheckState.Checked if _CHECKED(VALUE) else Qt.CheckState.Unchecked)
+            else:
+                WIDGET.setText("" if VALUE is None else str(VALUE))
         case QDateEdit():
             if not VALUE:
                 WIDGET.setDate(QDate(WIDGET.minimumDate()))
@@ -182,6 +491,7 @@ def WIDGET_RD(WIDGET: QWidget) -> Any:
         - QSpinBox / QDoubleSpinBox
         - QCheckBox
         - QDateEdit <str: "yyyy-mm-dd"> / QTimeEdit <str: "hh:mm">
+        - QTableWidgetItem (CELL_CHECKITEM)
     '''
     match WIDGET:
         case QLineEdit() | QTextEdit():
@@ -204,6 +514,10 @@ def WIDGET_RD(WIDGET: QWidget) -> Any:
             return f"{WIDGET.time().hour():02d}:{WIDGET.time().minute():02d}"
         case QPushButton():
             return WIDGET.text()
+        case QTableWidgetItem(): # CELL_CHECKITEM
+            if WIDGET.data(Qt.ItemDataRole.UserRole) == "checkable":
+                return WIDGET.checkState() == Qt.CheckState.Checked
+            return WIDGET.text()
         case QWidget(): # <LAYOUT> ⚠️
             for child in WIDGET.findChildren(QWidget):
                 try:
@@ -287,6 +601,7 @@ def WIDGET_CONNECT(WIDGET, FUNCTION):
         - QDateEdit
         - QTimeEdit
         - QWidget <LAYOUT>: QCheckBox
+        - QTableWidgetItem (CELL_CHECKITEM): FUNCTION(check state) on each toggle
     '''
     ## QComboBox
     if type(WIDGET) == QComboBox:
@@ -318,6 +633,14 @@ def WIDGET_CONNECT(WIDGET, FUNCTION):
         CHILD = WIDGET.findChild(type(QCheckBox()))
         if type(CHILD) == QCheckBox:
             CHILD.stateChanged.connect(FUNCTION)
+    ## QTableWidgetItem <CELL_CHECKITEM>
+    elif isinstance(WIDGET, QTableWidgetItem) and WIDGET.tableWidget() is not None:
+        STATE = [WIDGET.checkState()]
+        def item_changed(ITEM: QTableWidgetItem) -> None:
+            if ITEM is WIDGET and ITEM.checkState() != STATE[0]: # itemChanged is also emitted for text / flags
+                STATE[0] = ITEM.checkState()
+                FUNCTION(STATE[0].value)
+        WIDGET.tableWidget().itemChanged.connect(item_changed)
     ## NOT IMPLEMENTED
     else:
         print("WIDGET_CONNECT", type(WIDGET), "/ NOT IMPLEMENTED")
@@ -331,6 +654,8 @@ def CELL_WR(TABLE: QTableWidget, ROW: int, COLUMN: Union[int, str], VALUE: Any):
     WIDGET = TABLE.cellWidget(ROW, COLUMN_INDEX)
     if WIDGET:
         WIDGET_WR(WIDGET, VALUE)
+    elif TABLE.item(ROW, COLUMN_INDEX) and TABLE.item(ROW, COLUMN_INDEX).data(Qt.ItemDataRole.UserRole) == "checkable":
+        WIDGET_WR(TABLE.item(ROW, COLUMN_INDEX), VALUE)
     else:
         ITEM = QTableWidgetItem()
         if VALUE != None:
@@ -426,7 +751,7 @@ def CELL_READONLY(TABLE: QTableWidget, ROW: int, COLUMN: Union[int, str]) -> Non
     ## TABLE ITEM
     ITEM: QTableWidgetItem = TABLE.item(ROW, COLUMN_INDEX)
     if ITEM:
-        ITEM.setFlags(ITEM.flags() ^ Qt.ItemFlag.ItemIsEditable)
+        ITEM.setFlags(ITEM.flags() & ~(Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsUserCheckable))
         return
     ## NULL ITEM
     ITEM = QTableWidgetItem()
@@ -458,13 +783,15 @@ def CELL_EDITABLE(TABLE: QTableWidget, ROW: int, COLUMN: Union[int, str], EDITAB
         TABLE.setItem(ROW, COLUMN_INDEX, ITEM)
 
     FLAGS = ITEM.flags()
+    # Las celdas checkable (CELL_CHECKITEM) se editan con la bandera de check
+    FLAG = Qt.ItemFlag.ItemIsUserCheckable if ITEM.data(Qt.ItemDataRole.UserRole) == "checkable" else Qt.ItemFlag.ItemIsEditable
 
     if EDITABLE:
         # Agregamos la bandera de edición
-        FLAGS |= Qt.ItemFlag.ItemIsEditable
+        FLAGS |= FLAG
     else:
         # Quitamos la bandera de edición
-        FLAGS &= ~Qt.ItemFlag.ItemIsEditable
+        FLAGS &= ~FLAG
 
     ITEM.setFlags(FLAGS)
 
@@ -516,6 +843,8 @@ def CELL_CHECKSTATE(TABLE: QTableWidget, ROW: int, COLUMN: Union[int, str], VALU
 def CELL_CHECKBOX(TABLE: QTableWidget, ROW: int, COLUMN: Union[int, str], STATE: bool = False) -> CheckBoxCell:
     '''
     setCellWidget -> QWidget
+
+    ** For large tables use CELL_CHECKITEM (no widget per cell)
     '''
     COLUMN_INDEX = TBL_GET_HEADER_INDEX(TABLE, COLUMN)
 
@@ -530,6 +859,28 @@ def CELL_CHECKBOX(TABLE: QTableWidget, ROW: int, COLUMN: Union[int, str], STATE:
     TABLE.setCellWidget(ROW, COLUMN_INDEX, checkBox)
     return checkBox
 
+def CELL_CHECKITEM(TABLE: QTableWidget, ROW: int, COLUMN: Union[int, str], STATE: bool = False) -> QTableWidgetItem:
+    '''
+    setItem -> QTableWidgetItem <checkable>
+
+    Same as CELL_CHECKBOX without a cell widget: the check box is painted centered by CheckBoxDelegate,
+    read / write it with CELL_RD / CELL_WR or WIDGET_RD / WIDGET_WR / WIDGET_CONNECT over the returned item
+
+    Signal : itemChanged
+    '''
+    COLUMN_INDEX = TBL_GET_HEADER_INDEX(TABLE, COLUMN)
+    _CHECKBOX_DELEGATE(TABLE)
+    if TABLE.cellWidget(ROW, COLUMN_INDEX):
+        TABLE.removeCellWidget(ROW, COLUMN_INDEX)
+
+    ITEM = QTableWidgetItem()
+    ITEM.setFlags((ITEM.flags() | Qt.ItemFlag.ItemIsUserCheckable) & ~Qt.ItemFlag.ItemIsEditable)
+    ITEM.setData(Qt.ItemDataRole.UserRole, "checkable")
+    ITEM.setCheckState(Qt.CheckState.Checked if bool(STATE) else Qt.CheckState.Unchecked)
+
+    TABLE.setItem(ROW, COLUMN_INDEX, ITEM)
+    return ITEM
+
 # def CELL_CHECKBOX_LAYOUT(TABLE: QTableWidget, ROW: int, COLUMN: Union[int, str], STATE: bool = False) -> QCheckBox:
 #     '''
 #     setCellWidget -> QWidget <QCheckBox>
@@ -668,85 +1019,437 @@ def TBL_INIT(TABLE: QTableWidget) -> None:
     '''
     Reset the Table, set 0 rowCount
     '''
+    _TBL_POP_CANCEL(TABLE)
+    TABLE._pandas_dtypes = {}
+    TABLE._pandas_df = None
+    TABLE._protected_columns = set()
     TABLE.setEnabled(False)
     TABLE.setRowCount(0)
     TABLE.setColumnCount(0)
     TABLE.setEnabled(True)
 
-def TBL_POP_PANDAS_DF(TABLE: QTableWidget, DATAFRAME: 'pd.DataFrame', HIDE_COLUMNS: list=[], PROTECTED_COLUMNS: list=[]) -> None:
+class TablePopulator(QObject):
+    '''
+    Chunked population of a QTableWidget from the event loop (TBL_POP_PANDAS_DF CHUNKED mode)
+
+    The first screenful of rows is written at once, the rest in slices of BUDGET_MS
+    milliseconds per event loop iteration, so the GUI keeps responding.
+
+    `Signals:`
+        - progress(int, int): rows populated, total rows
+        - finished(): all the rows are populated
+        - canceled(): cancel() was called before the end
+    '''
+    progress = Signal(int, int)
+    finished = Signal()
+    canceled = Signal()
+
+    def __init__(self, TABLE: QTableWidget, DATAFRAME: 'pd.DataFrame', PROTECTED: set, BUDGET_MS: int = 10):
+        super().__init__(TABLE)
+        self.table = TABLE
+        self.renderers: List[_ColumnRenderer] = _TBL_RENDERERS(TABLE, DATAFRAME, PROTECTED)
+        self.budget_ms = BUDGET_MS
+        self.row: int = 0
+        self.total: int = len(DATAFRAME.index)
+        self._sorting: bool = TABLE.isSortingEnabled()
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._step)
+
+    def start(self) -> None:
+        '''
+        Populate the first screenful and schedule the rest of the rows
+        '''
+        self.table.setSortingEnabled(False)
+        ROW_HEIGHT = max(1, self.table.verticalHeader().defaultSectionSize())
+        self._populate(max(1, self.table.viewport().height() // ROW_HEIGHT + 1))
+        self.table.resizeColumnsToContents()
+        if self.row < self.total:
+            self._timer.start()
+        else:
+            self._finish()
+
+    def cancel(self) -> None:
+        '''
+        Stop the population (the rows already written are kept)
+        '''
+        if not self.isRunning():
+            return
+        self._timer.stop()
+        self.table.setSortingEnabled(self._sorting)
+        self.canceled.emit()
+
+    def isRunning(self) -> bool:
+        return self._timer.isActive()
+
+    def _step(self) -> None:
+        CLOCK = QElapsedTimer()
+        CLOCK.start()
+        while self.row < self.total and CLOCK.elapsed() < self.budget_ms:
+            self._populate(64)
+        if self.row >= self.total:
+            self._timer.stop()
+            self._finish()
+
+    def _populate(self, ROWS: int) -> None:
+        STOP = min(self.row + ROWS, self.total)
+        _TBL_POP_ROWS(self.table, self.renderers, self.row, STOP)
+        self.row = STOP
+        self.progress.emit(self.row, self.total)
+
+    def _finish(self) -> None:
+        self.table.setSortingEnabled(self._sorting)
+        self.table.resizeColumnsToContents()
+        self.finished.emit()
+
+def _TBL_POP_CANCEL(TABLE: QTableWidget) -> None:
+    '''
+    Cancel the running TablePopulator of the table (if any)
+    '''
+    POPULATOR: TablePopulator = getattr(TABLE, "_populator", None)
+    if POPULATOR is not None:
+        POPULATOR.cancel()
+        POPULATOR.deleteLater()
+        TABLE._populator = None
+
+class _TableOrderWatch(QObject):
+    '''
+    Flag (sorted) set when the rows of the table are reordered (sortItems / header click):
+    the table rows don't follow the DataFrame snapshot of TBL_UPDATE_PANDAS_DF anymore
+    '''
+    def __init__(self, TABLE: QTableWidget):
+        super().__init__(TABLE)
+        self.sorted: bool = False
+        TABLE.model().layoutChanged.connect(self.changed)
+
+    def changed(self, *args) -> None:
+        self.sorted = True
+
+def _TBL_ORDER_WATCH(TABLE: QTableWidget) -> None:
+    '''
+    (Re)start the _TableOrderWatch of the table
+    '''
+    WATCH: _TableOrderWatch = getattr(TABLE, "_pandas_order", None)
+    if WATCH is None:
+        WATCH = _TableOrderWatch(TABLE)
+        TABLE._pandas_order = WATCH
+    WATCH.sorted = False
+
+def TBL_POP_PANDAS_DF(TABLE: QTableWidget, DATAFRAME: 'pd.DataFrame', HIDE_COLUMNS: list=[], PROTECTED_COLUMNS: list=[], CHUNKED: bool = False, BUDGET_MS: int = 10) -> Union[TablePopulator, None]:
     '''
     Populate QTable with a Pandas DataFrame
     
     VARIABLES:
         - HIDE_COLUMNS: list **Hide the list of columns by int (column index) or str (calumn name)
         - PROTECTED_COLUMNS: list **Config the list of columns selected by int (column index) or str (calumn name)
+        - CHUNKED: bool **Populate the rows from the event loop in slices of BUDGET_MS (ms), return the running TablePopulator
     
     BUG: 
         - Some times show: QAbstractItemView::closeEditor called with an editor that does not belong to this view
         - Add the TBL_FIELD_FORMAT class
     '''
     ## INIT TBL
+    _TBL_POP_CANCEL(TABLE)
     TABLE.setEnabled(False)
     TABLE.setRowCount(0)
     TABLE.setColumnCount(0)
     ## 
     columns = DATAFRAME.columns.to_list()
+    TABLE._pandas_dtypes = {str(col): dtype for col, dtype in DATAFRAME.dtypes.items()} # TBL_GET_PANDAS_DF
+    TABLE._pandas_df = DATAFRAME.copy() # TBL_UPDATE_PANDAS_DF
+    _TBL_ORDER_WATCH(TABLE)
     TABLE.setColumnCount(len(columns))
     TABLE.setHorizontalHeaderLabels(columns)
     TABLE.setRowCount(len(DATAFRAME.index))
-
-    # def is_protected(col_idx):
-    #     # Normalize protected columns to indices for quick lookup
-    #     protected_indices = []
-    #     for prot in PROTECTED_COLUMNS:
-    #         if isinstance(prot, int):
-    #             protected_indices.append(prot)
-    #         elif isinstance(prot, str) and prot in columns:
-    #             protected_indices.append(columns.index(prot))
-    #     return col_idx in protected_indices
-    
-    ## POPULATE TABLE CELLS
-    # Populate table cells
-    for row_idx, (_, row_data) in enumerate(DATAFRAME.iterrows()):
-        for col_idx, col_name in enumerate(columns):
-            cell_value = row_data[col_name]
-            if pd.isnull(cell_value):
-                continue
-            
-            # Decide which cell widget to use based on dtype
-            dtype = DATAFRAME[col_name].dtype
-            if dtype == bool:
-                CELL_CHECKBOX(TABLE, row_idx, col_idx, cell_value)
-            # elif dtype.kind in ('i', 'u', 'f'):  # integer, unsigned, float
-            #     CELL_SPINBOX(TABLE, row_idx, col_idx, cell_value)
-            # elif dtype.kind == 'M':  # datetime64
-            #     CELL_DATEEDIT(TABLE, row_idx, col_idx, cell_value)
-            elif dtype == object and isinstance(cell_value, str):
-                CELL_TX(TABLE, row_idx, col_idx, cell_value)
-            else:
-                CELL_WR(TABLE, row_idx, col_idx, cell_value)
-            
-            # Apply protection if column is in protected list
-            # if is_protected(col_idx):
-            if col_name in PROTECTED_COLUMNS or col_idx in PROTECTED_COLUMNS:
-                CELL_READONLY(TABLE, row_idx, col_idx)
+    PROTECTED: set = _TBL_COLUMNS_INDEX(columns, PROTECTED_COLUMNS)
+    TABLE._protected_columns = PROTECTED # TBL_PASTE_TSV
 
     ## HIDE COLUMS
-    for col in HIDE_COLUMNS:
-        if isinstance(col, int) and 0 <= col < len(columns):
-            TABLE.setColumnHidden(col, True)
-        elif isinstance(col, str) and col in columns:
-            TABLE.setColumnHidden(columns.index(col), True)
+    for col in _TBL_COLUMNS_INDEX(columns, HIDE_COLUMNS):
+        TABLE.setColumnHidden(col, True)
+
+    ## POPULATE TABLE CELLS (CHUNKED)
+    if CHUNKED:
+        TABLE.setEnabled(True)
+        POPULATOR = TablePopulator(TABLE, DATAFRAME, PROTECTED, BUDGET_MS)
+        TABLE._populator = POPULATOR
+        POPULATOR.start()
+        return POPULATOR
+
+    ## POPULATE TABLE CELLS
+    _TBL_POP_ROWS(TABLE, _TBL_RENDERERS(TABLE, DATAFRAME, PROTECTED), 0, len(DATAFRAME.index))
     
     ## POP ROWS
     TABLE.resizeColumnsToContents()
     TABLE.setEnabled(True)
 
+class _ColumnRenderer:
+    '''
+    Populate renderer of a DataFrame column
+
+    The dtype, protection and null handling of the column are resolved once: the values come
+    from the column list and each cell is a single item constructor / clone call
+    '''
+    __slots__ = ("column", "values", "nulls", "make")
+
+    def __init__(self, COLUMN: int, SERIES: 'pd.Series', PROTECTED: bool):
+        self.column: int = COLUMN
+        self.values: list = SERIES.tolist()
+        self.nulls: list = SERIES.isna().tolist()
+        if SERIES.dtype == bool:
+            # CELL_CHECKITEM / CELL_READONLY
+            CHECKED, UNCHECKED = QTableWidgetItem(), QTableWidgetItem()
+            for ITEM, STATE in ((CHECKED, Qt.CheckState.Checked), (UNCHECKED, Qt.CheckState.Unchecked)):
+                FLAGS = (ITEM.flags() | Qt.ItemFlag.ItemIsUserCheckable) & ~Qt.ItemFlag.ItemIsEditable
+                if PROTECTED:
+                    FLAGS &= ~Qt.ItemFlag.ItemIsUserCheckable
+                ITEM.setFlags(FLAGS)
+                ITEM.setData(Qt.ItemDataRole.UserRole, "checkable")
+                ITEM.setCheckState(STATE)
+            self.make = lambda VALUE: (CHECKED if VALUE else UNCHECKED).clone()
+        elif PROTECTED:
+            # CELL_WR / CELL_READONLY
+            FLAGS = QTableWidgetItem().flags() & ~(Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsUserCheckable)
+            def make(VALUE: Any) -> QTableWidgetItem:
+                ITEM = QTableWidgetItem(str(VALUE))
+                ITEM.setFlags(FLAGS)
+                return ITEM
+            self.make = make
+        else:
+            # CELL_WR
+            self.make = lambda VALUE: QTableWidgetItem(str(VALUE))
+
+    def render(self, TABLE: QTableWidget, START: int, STOP: int, OFFSET: int = 0) -> None:
+        '''
+        Populate the column cells of the rows [START, STOP), in the table rows + OFFSET (null values are not written)
+        '''
+        setItem, make, values, nulls, column = TABLE.setItem, self.make, self.values, self.nulls, self.column
+        for row in range(START, STOP):
+            if not nulls[row]:
+                setItem(row + OFFSET, column, make(values[row]))
+
+    def write(self, TABLE: QTableWidget, ROW: int, POSITION: int) -> None:
+        '''
+        Write (or clear if null) the value POSITION of the column in the table ROW
+        '''
+        if self.nulls[POSITION]:
+            TABLE.removeCellWidget(ROW, self.column)
+            TABLE.takeItem(ROW, self.column)
+        else:
+            TABLE.setItem(ROW, self.column, self.make(self.values[POSITION]))
+
+def _TBL_RENDERERS(TABLE: QTableWidget, DATAFRAME: 'pd.DataFrame', PROTECTED: set) -> List[_ColumnRenderer]:
+    '''
+    Compile the _ColumnRenderer of every DataFrame column
+    '''
+    if any(dtype == bool for dtype in DATAFRAME.dtypes):
+        _CHECKBOX_DELEGATE(TABLE)
+    return [_ColumnRenderer(col_idx, DATAFRAME.iloc[:, col_idx], col_idx in PROTECTED) for col_idx in range(len(DATAFRAME.columns))]
+
+def _TBL_POP_ROWS(TABLE: QTableWidget, RENDERERS: List[_ColumnRenderer], START: int, STOP: int, ROW: int = None) -> None:
+    '''
+    Populate the table cells of the DataFrame rows [START, STOP)
+
+    ** ROW: table row of the DataFrame row START (default START)
+    '''
+    OFFSET: int = 0 if ROW is None else ROW - START
+    for RENDERER in RENDERERS:
+        RENDERER.render(TABLE, START, STOP, OFFSET)
+
+def TBL_UPDATE_PANDAS_DF(TABLE: QTableWidget, DATAFRAME: 'pd.DataFrame', HIDE_COLUMNS: list=[], PROTECTED_COLUMNS: list=[]) -> None:
+    '''
+    Update a QTable populated with TBL_POP_PANDAS_DF to a new version of the DataFrame
+
+    Rows are matched by the DataFrame index: deleted rows are removed, changed cells are
+    rewritten and new rows are appended at the end, the rest of the table (scroll position,
+    selection, items) is kept.
+
+    ** HIDE_COLUMNS / PROTECTED_COLUMNS are applied as in TBL_POP_PANDAS_DF (the columns whose
+       protection changed are rewritten)
+
+    ** Falls back to TBL_POP_PANDAS_DF if the table wasn't populated with a DataFrame with the
+       same columns / dtypes, if the index isn't unique, if a CHUNKED population is running or
+       if the table is sorted (sorting enabled or rows reordered): table row i isn't DataFrame row i
+    '''
+    import numpy as np
+    import pandas as pd
+    OLD: 'pd.DataFrame' = getattr(TABLE, "_pandas_df", None)
+    POPULATOR: TablePopulator = getattr(TABLE, "_populator", None)
+    WATCH: _TableOrderWatch = getattr(TABLE, "_pandas_order", None)
+    if (
+        OLD is None
+        or WATCH is None
+        or WATCH.sorted
+        or TABLE.isSortingEnabled()
+        or (POPULATOR is not None and POPULATOR.isRunning())
+        or OLD.columns.to_list() != DATAFRAME.columns.to_list()
+        or not OLD.dtypes.equals(DATAFRAME.dtypes)
+        or not DATAFRAME.index.is_unique
+        or not OLD.index.is_unique
+        or TABLE.rowCount() != len(OLD.index)
+    ):
+        TBL_POP_PANDAS_DF(TABLE, DATAFRAME, HIDE_COLUMNS, PROTECTED_COLUMNS)
+        return
+    columns = DATAFRAME.columns.to_list()
+    PROTECTED: set = _TBL_COLUMNS_INDEX(columns, PROTECTED_COLUMNS)
+    REPROTECTED: set = PROTECTED ^ getattr(TABLE, "_protected_columns", set()) # rewritten whole
+    TABLE._protected_columns = PROTECTED # TBL_PASTE_TSV
+    ## DIFF (vectorized)
+    DELETED = np.flatnonzero(~OLD.index.isin(DATAFRAME.index))
+    KEPT = OLD.index[OLD.index.isin(DATAFRAME.index)]
+    INSERTED = DATAFRAME.index[~DATAFRAME.index.isin(OLD.index)]
+    BEFORE = OLD.loc[KEPT]
+    AFTER = DATAFRAME.loc[KEPT]
+    CHANGES: dict = {}
+    for col_idx, col_name in enumerate(columns):
+        if col_idx in REPROTECTED:
+            continue
+        A, B = BEFORE[col_name], AFTER[col_name]
+        # Nullable dtypes (Int64, string, boolean): ne() is NA where a value is NA
+        CHANGED = (A.ne(B).fillna(True) & ~(A.isna() & B.isna())).to_numpy(dtype=bool)
+        if CHANGED.any():
+            CHANGES[col_idx] = np.flatnonzero(CHANGED)
+    ## APPLY
+    TABLE.setUpdatesEnabled(False)
+    try:
+        # Deleted rows, by contiguous blocks from the bottom
+        for start, count in reversed(_RUNS(DELETED)):
+            TABLE.model().removeRows(int(start), int(count))
+        # Changed cells
+        for col_idx, rows in CHANGES.items():
+            RENDERER = _ColumnRenderer(col_idx, AFTER.iloc[:, col_idx], col_idx in PROTECTED)
+            for row in rows.tolist():
+                RENDERER.write(TABLE, row, row)
+        # Inserted rows
+        if len(INSERTED):
+            ROW: int = TABLE.rowCount()
+            NEW_ROWS = DATAFRAME.loc[INSERTED]
+            TABLE.setRowCount(ROW + len(INSERTED))
+            _TBL_POP_ROWS(TABLE, _TBL_RENDERERS(TABLE, NEW_ROWS, PROTECTED), 0, len(INSERTED), ROW)
+        ## SNAPSHOT (table row order)
+        TABLE._pandas_df = pd.concat([AFTER, DATAFRAME.loc[INSERTED]]).copy()
+        # Columns with a new protection
+        for col_idx in sorted(REPROTECTED):
+            RENDERER = _ColumnRenderer(col_idx, TABLE._pandas_df.iloc[:, col_idx], col_idx in PROTECTED)
+            for row in range(TABLE.rowCount()):
+                RENDERER.write(TABLE, row, row)
+        # Hidden columns
+        HIDDEN: set = _TBL_COLUMNS_INDEX(columns, HIDE_COLUMNS)
+        for col_idx in range(len(columns)):
+            TABLE.setColumnHidden(col_idx, col_idx in HIDDEN)
+    finally:
+        TABLE.setUpdatesEnabled(True)
+
+def _RUNS(POSITIONS: 'np.ndarray') -> List[Tuple[int, int]]:
+    '''
+    Group sorted positions in contiguous runs: [(start, count), ...]
+    '''
+    import numpy as np
+    if len(POSITIONS) == 0:
+        return []
+    BREAKS = np.flatnonzero(np.diff(POSITIONS) != 1) + 1
+    return [(run[0], len(run)) for run in np.split(POSITIONS, BREAKS)]
+
+def TBL_POP_PANDAS_MODEL(TABLE: QTableView, DATAFRAME: 'pd.DataFrame', HIDE_COLUMNS: list=[], PROTECTED_COLUMNS: list=[]) -> PandasTableModel:
+    '''
+    Populate QTableView with a Pandas DataFrame through a PandasTableModel
+
+    Same VARIABLES as TBL_POP_PANDAS_DF, but no item or cell widget is created,
+    the view reads the values from the DataFrame only for the visible rows
+
+    ** Use TBL_GET_PANDAS_DF to get back the (edited) DataFrame
+    '''
+    MODEL = PandasTableModel(DATAFRAME, PROTECTED_COLUMNS, parent=TABLE)
+    TABLE.setModel(MODEL)
+    _CHECKBOX_DELEGATE(TABLE)
+    ## HIDE COLUMS
+    for col in range(MODEL.columnCount()):
+        TABLE.setColumnHidden(col, False)
+    for col in _TBL_COLUMNS_INDEX(DATAFRAME.columns.to_list(), HIDE_COLUMNS):
+        TABLE.setColumnHidden(col, True)
+    ##
+    TABLE.resizeColumnsToContents()
+    return MODEL
+
+def TBL_POP_ITERATOR(TABLE: QTableView, ROWS: Iterable, HEADERS: Union[List[str], bool, None] = None, HIDE_COLUMNS: list=[], BATCH: int = 256) -> IteratorTableModel:
+    '''
+    Populate QTableView with the rows of an iterator, loaded on demand as the view is scrolled
+
+    VARIABLES:
+        - ROWS: DB-API cursor, csv.reader, generator of dicts / sequences...
+        - HEADERS: list **Column names (default: cursor.description / keys of the first dict) or True to use the first row
+        - HIDE_COLUMNS: list **Hide the list of columns by int (column index) or str (calumn name)
+        - BATCH: int **Rows loaded per fetch
+
+    ** Read-only, use IteratorTableModel.fetchAll() before TBL_GET_PANDAS_DF to get every row
+    '''
+    MODEL = IteratorTableModel(ROWS, HEADERS, BATCH, parent=TABLE)
+    TABLE.setModel(MODEL)
+    _CHECKBOX_DELEGATE(TABLE)
+    ## HIDE COLUMS
+    for col in _TBL_COLUMNS_INDEX(MODEL.headers, HIDE_COLUMNS):
+        TABLE.setColumnHidden(col, True)
+    ##
+    TABLE.resizeColumnsToContents()
+    return MODEL
+
+def _TBL_COLUMNS_INDEX(COLUMNS: list, SELECTION: list) -> set:
+    '''
+    Normalize a list of columns by int (column index) or str (column name) to a set of column indexes
+    '''
+    INDEXES: set = set()
+    for col in SELECTION:
+        if isinstance(col, int) and 0 <= col < len(COLUMNS):
+            INDEXES.add(col)
+        elif isinstance(col, str) and col in COLUMNS:
+            INDEXES.add(COLUMNS.index(col))
+    return INDEXES
+
+class _HeaderIndex:
+    '''
+    Per-table cache of the horizontal headers (name list and name -> column index)
+
+    Built once and invalidated by the model signals that change the headers or the columns
+    '''
+    def __init__(self, TABLE: QTableView):
+        self.model = None
+        self.names: List[str] = []
+        self.index: dict = {}
+        self.dirty: bool = True
+        self.build(TABLE)
+
+    def build(self, TABLE: QTableView) -> None:
+        MODEL = TABLE.model()
+        if MODEL is not self.model:
+            self.model = MODEL
+            for signal in (MODEL.headerDataChanged, MODEL.columnsInserted, MODEL.columnsRemoved, MODEL.columnsMoved, MODEL.modelReset, MODEL.layoutChanged):
+                signal.connect(self.invalidate)
+        self.names = [str(MODEL.headerData(i, Qt.Orientation.Horizontal, Qt.ItemDataRole.DisplayRole)) for i in range(MODEL.columnCount())]
+        self.index = {}
+        for i, name in enumerate(self.names):
+            self.index.setdefault(name, i) # First column with the name, like list.index
+        self.dirty = False
+
+    def invalidate(self, *args) -> None:
+        self.dirty = True
+
+def _TBL_HEADERS(TABLE: QTableView) -> _HeaderIndex:
+    '''
+    Get the (valid) _HeaderIndex of the selected table
+    '''
+    CACHE: _HeaderIndex = getattr(TABLE, "_header_index", None)
+    if CACHE is None:
+        CACHE = _HeaderIndex(TABLE)
+        TABLE._header_index = CACHE
+    elif CACHE.dirty or CACHE.model is not TABLE.model():
+        CACHE.build(TABLE)
+    return CACHE
+
 def TBL_GET_HEADERS(TABLE: QTableWidget) -> List[str]:
     '''
     Get a list of horizontal headers in the selected Qtable
 
-    ** If header name is empty, function return the int of column
+    ** The headers are cached per table and refreshed when the headers / columns change
     '''
     # HEADERS: list = []
     # for head in range(TABLE.columnCount()):
@@ -755,7 +1458,7 @@ def TBL_GET_HEADERS(TABLE: QTableWidget) -> List[str]:
     #         header_text = head
     #     HEADERS.append(header_text)
     # return HEADERS
-    return [TABLE.horizontalHeaderItem(i).text() for i in range(TABLE.columnCount())]
+    return list(_TBL_HEADERS(TABLE).names)
 
 def TBL_GET_HEADER_INDEX(TABLE: QTableWidget, COLUMN: Union[int, str]) -> int:
     '''
@@ -766,13 +1469,12 @@ def TBL_GET_HEADER_INDEX(TABLE: QTableWidget, COLUMN: Union[int, str]) -> int:
     if type(COLUMN) == int:
         return COLUMN
     elif type(COLUMN) == str:
-        HEADERS = TBL_GET_HEADERS(TABLE)
         # if COLUMN in HEADERS: 
         #     return HEADERS.index(COLUMN)
         # else:
         #     print(f"CELL_RD ERROR / WRONG HEADER NAME [{COLUMN}]")
         #     return None
-        return HEADERS.index(COLUMN) if COLUMN in HEADERS else None
+        return _TBL_HEADERS(TABLE).index.get(COLUMN)
 
 def TBL_FIELD_RESIZE(TABLE: QTableWidget, header: Union[int, str]) -> None:
     '''
@@ -783,20 +1485,403 @@ def TBL_FIELD_RESIZE(TABLE: QTableWidget, header: Union[int, str]) -> None:
 def TBL_GET_PANDAS_DF(TABLE: QTableWidget) -> 'pd.DataFrame':
     '''
     Create Pandas DataFrame from QTable data
+
+    The table is read by columns (one pass per column, without CELL_RD) and each column is
+    converted to a typed array:
+        - Tables populated with TBL_POP_PANDAS_DF: the source DataFrame dtype of the column
+        - Other tables: the cell type (checkable / QCheckBox -> bool, QSpinBox -> int,
+          QDoubleSpinBox -> float, QDateEdit -> datetime64), else str (object)
+
+    ** With a QTableView populated by TBL_POP_PANDAS_MODEL return a copy of the model DataFrame
+    ** With a QTableView populated by TBL_POP_ITERATOR return the rows fetched so far
     '''
+    import pandas as pd
+    if isinstance(TABLE.model(), PandasTableModel):
+        return TABLE.model().dataframe.copy()
+    if isinstance(TABLE.model(), IteratorTableModel):
+        return pd.DataFrame.from_records(TABLE.model().rows, columns=TABLE.model().headers)
     HEADERS: list = TBL_GET_HEADERS(TABLE)
+    DTYPES: dict = getattr(TABLE, "_pandas_dtypes", {})
     ## 
     DATAFRAME: dict = {}
-    for field in HEADERS: 
-        LIST: list = []
-        for row in range(TABLE.rowCount()):
-            VALUE = CELL_RD(TABLE, row, field)
-            LIST.append(VALUE)
-        DATAFRAME[field] = LIST
+    for column, field in enumerate(HEADERS): 
+        VALUES, KINDS = _TBL_COLUMN_READ(TABLE, column)
+        DATAFRAME[field] = _COLUMN_ARRAY(VALUES, KINDS, DTYPES.get(field))
     ## 
     DATAFRAME = pd.DataFrame(DATAFRAME)
     return DATAFRAME
 
+_CELL_READERS: dict = {
+    ## cellWidget type: (reader, kind)
+    CheckBoxCell: (CheckBoxCell.isChecked, "bool"),
+    QCheckBox: (QCheckBox.isChecked, "bool"),
+    QSpinBox: (QSpinBox.value, "int"),
+    QDoubleSpinBox: (QDoubleSpinBox.value, "float"),
+    QDateEdit: (lambda widget: widget.date().toPython(), "date"),
+    QLineEdit: (QLineEdit.text, "str"),
+    QTextEdit: (QTextEdit.toPlainText, "str"),
+    QComboBox: (QComboBox.currentText, "str"),
+    QPushButton: (QPushButton.text, "str"),
+}
+
+def _TBL_COLUMN_READ(TABLE: QTableWidget, COLUMN_INDEX: int) -> Tuple[list, set]:
+    '''
+    Read all the values of a column in one pass
+
+    Return the list of values and the set of value kinds found ("bool", "int", "float", "date", "str")
+    '''
+    VALUES: list = []
+    KINDS: set = set()
+    for row in range(TABLE.rowCount()):
+        CELL = TABLE.cellWidget(row, COLUMN_INDEX)
+        if CELL is not None:
+            READER = _CELL_READERS.get(type(CELL))
+            if READER:
+                VALUES.append(READER[0](CELL))
+                KINDS.add(READER[1])
+            else:
+                VALUES.append(WIDGET_RD(CELL))
+                KINDS.add("str")
+            continue
+        ITEM = TABLE.item(row, COLUMN_INDEX)
+        if ITEM is None:
+            VALUES.append(None)
+        elif ITEM.data(Qt.ItemDataRole.UserRole) == "checkable":
+            VALUES.append(ITEM.checkState() == Qt.CheckState.Checked)
+            KINDS.add("bool")
+        else:
+            TEXT = ITEM.text().strip()
+            VALUES.append(TEXT if TEXT else None)
+            KINDS.add("str")
+    return VALUES, KINDS
+
+def _COLUMN_ARRAY(VALUES: list, KINDS: set, DTYPE: Any = None) -> Any:
+    '''
+    Convert the values of a column to a typed array (source DTYPE first, else the kinds of the cells)
+    '''
+    import numpy as np
+    import pandas as pd
+    NULLS: bool = any(value is None for value in VALUES)
+    if DTYPE is not None:
+        try:
+            match DTYPE.kind:
+                case "b":
+                    if not NULLS and KINDS <= {"bool"}:
+                        return np.array(VALUES, dtype=bool)
+                case "i" | "u" | "f" if not isinstance(DTYPE, np.dtype):
+                    # Nullable extension dtype (Int64, Float64...): NA kept, no numpy cast
+                    return pd.to_numeric(pd.Series(VALUES, dtype=object), errors="coerce").astype(DTYPE)
+                case "i" | "u" | "f":
+                    try: # Exact str -> number parse
+                        return np.array([np.nan if value is None else value for value in VALUES], dtype=DTYPE)
+                    except (TypeError, ValueError):
+                        pass
+                    ARRAY = pd.to_numeric(pd.Series(VALUES, dtype=object), errors="coerce")
+                    if DTYPE.kind == "f" or not ARRAY.isna().any():
+                        return ARRAY.to_numpy().astype(DTYPE)
+                    return ARRAY.to_numpy()
+                case "M":
+                    return pd.to_datetime(pd.Series(VALUES, dtype=object), errors="coerce")
+                case "m":
+                    return pd.to_timedelta(pd.Series(VALUES, dtype=object), errors="coerce").to_numpy()
+                case "O" if DTYPE == object:
+                    pass
+                case _:
+                    return pd.Series(VALUES, dtype=object).astype(DTYPE)
+        except (TypeError, ValueError):
+            pass
+    elif not NULLS and len(KINDS) == 1:
+        match next(iter(KINDS)):
+            case "bool":
+                return np.array(VALUES, dtype=bool)
+            case "int":
+                return np.array(VALUES, dtype=np.int64)
+            case "float":
+                return np.array(VALUES, dtype=np.float64)
+            case "date":
+                return np.array(VALUES, dtype="datetime64[ns]")
+    return np.array(VALUES, dtype=object)
+
+def TBL_WRITE_BLOCK(TABLE: QTableWidget, ROW: int, COLUMN: Union[int, str], VALUES: Any) -> None:
+    '''
+    Write a 2D block of values with the top-left corner in the selected cell
+
+    VARIABLES:
+        - VALUES: 2D list / tuple, NumPy array or Pandas DataFrame (slice)
+
+    The block is written with signals, sorting and repaints suspended,
+    then a single dataChanged notification is emitted for the whole block
+
+    ** The table grows (rowCount / columnCount) if the block doesn't fit
+    ** Existing items are reused (flags like CELL_READONLY are kept)
+    ** Cell widgets and CELL_CHECKITEM cells are written with WIDGET_WR
+    '''
+    COLUMN_INDEX = TBL_GET_HEADER_INDEX(TABLE, COLUMN)
+    ROWS: list = _BLOCK_ROWS(VALUES)
+    if not ROWS:
+        return
+    N_ROWS: int = len(ROWS)
+    N_COLUMNS: int = max(len(values) for values in ROWS)
+    if N_COLUMNS == 0:
+        return
+    if ROW + N_ROWS > TABLE.rowCount():
+        TABLE.setRowCount(ROW + N_ROWS)
+    if COLUMN_INDEX + N_COLUMNS > TABLE.columnCount():
+        TABLE.setColumnCount(COLUMN_INDEX + N_COLUMNS)
+    with _TBL_BATCH(TABLE, ROW, COLUMN_INDEX, N_ROWS, N_COLUMNS):
+        for row, values in enumerate(ROWS, ROW):
+            for column, VALUE in enumerate(values, COLUMN_INDEX):
+                WIDGET = TABLE.cellWidget(row, column)
+                if WIDGET:
+                    WIDGET_WR(WIDGET, VALUE)
+                    continue
+                TEXT: str = "" if VALUE is None or _IS_NULL(VALUE) else str(VALUE)
+                ITEM = TABLE.item(row, column)
+                if ITEM is None:
+                    TABLE.setItem(row, column, QTableWidgetItem(TEXT))
+                elif ITEM.data(Qt.ItemDataRole.UserRole) == "checkable":
+                    WIDGET_WR(ITEM, VALUE)
+                else:
+                    ITEM.setText(TEXT)
+
+@contextmanager
+def _TBL_BATCH(TABLE: QTableWidget, ROW: int, COLUMN: int, N_ROWS: int, N_COLUMNS: int):
+    '''
+    Suspend signals, sorting and repaints of the table while a block of cells is written,
+    then emit a single dataChanged notification for the block
+    '''
+    MODEL = TABLE.model()
+    SORTING: bool = TABLE.isSortingEnabled()
+    UPDATES: bool = TABLE.updatesEnabled()
+    TABLE.setSortingEnabled(False)
+    TABLE.setUpdatesEnabled(False)
+    TABLE_BLOCKED: bool = TABLE.blockSignals(True)
+    MODEL_BLOCKED: bool = MODEL.blockSignals(True)
+    try:
+        yield
+    finally:
+        MODEL.blockSignals(MODEL_BLOCKED)
+        TABLE.blockSignals(TABLE_BLOCKED)
+        MODEL.dataChanged.emit(MODEL.index(ROW, COLUMN), MODEL.index(ROW + N_ROWS - 1, COLUMN + N_COLUMNS - 1))
+        TABLE.setSortingEnabled(SORTING)
+        TABLE.setUpdatesEnabled(UPDATES)
+
+def _BLOCK_ROWS(VALUES: Any) -> List[list]:
+    '''
+    Normalize a 2D list / tuple, NumPy array or Pandas DataFrame to a list of rows
+    '''
+    if VALUES is None:
+        return []
+    if hasattr(VALUES, "columns"): # DataFrame
+        VALUES = VALUES.to_numpy(dtype=object)
+    if hasattr(VALUES, "ndim"): # NumPy array / Series
+        if VALUES.ndim == 1:
+            VALUES = VALUES.reshape(1, -1)
+        return VALUES.tolist()
+    ROWS = list(VALUES)
+    if ROWS and not isinstance(ROWS[0], (list, tuple)):
+        return [ROWS]
+    return ROWS
+
+def _IS_NULL(VALUE: Any) -> bool:
+    '''
+    Scalar null check (None, NaN, NaT, pd.NA)
+
+    ** Plain Python values are checked without importing Pandas
+    '''
+    if VALUE is None:
+        return True
+    if type(VALUE) in (str, int, bool):
+        return False
+    if type(VALUE) is float:
+        return VALUE != VALUE
+    import pandas as pd
+    try:
+        return bool(pd.isnull(VALUE))
+    except (TypeError, ValueError):
+        return False
+
+def _TSV_TEXT(VALUE: Any) -> str:
+    '''
+    Clipboard text of a cell value (bool as TRUE / FALSE, dates in ISO format)
+    '''
+    if VALUE is None:
+        return ""
+    if VALUE is True or VALUE is False:
+        return "TRUE" if VALUE else "FALSE"
+    if hasattr(VALUE, "isoformat"):
+        return VALUE.isoformat()
+    return str(VALUE)
+
+def _TSV_ROWS(TEXT: str) -> List[List[str]]:
+    '''
+    Split a TSV text (Excel / LibreOffice clipboard) in rows of cells
+
+    ** Plain text is split with str.split, the csv module is only used if there are quoted cells
+    '''
+    if not TEXT:
+        return []
+    if '"' in TEXT:
+        ROWS = [row for row in csv.reader(StringIO(TEXT, newline=""), delimiter="\t")]
+        while ROWS and not ROWS[-1]:
+            ROWS.pop()
+        return ROWS
+    LINES: List[str] = TEXT.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    if LINES[-1] == "":
+        LINES.pop()
+    return [line.split("\t") for line in LINES]
+
+def TBL_COPY_TSV(TABLE: QTableWidget, CLIPBOARD: bool = True) -> str:
+    '''
+    Copy the selected cells as TSV (tab separated text, the Excel clipboard format)
+
+    VARIABLES:
+        - CLIPBOARD: bool **Set the text in the system clipboard
+
+    ** The bounding rectangle of the selection is copied, unselected cells inside it are empty
+    ** Hidden rows / columns are not copied
+    ** Cell widgets and CELL_CHECKITEM cells are read with their value (TRUE / FALSE for checkboxes)
+    '''
+    RANGES = TABLE.selectedRanges()
+    if not RANGES:
+        return ""
+    ROWS: List[int] = [row for row in range(min(r.topRow() for r in RANGES), max(r.bottomRow() for r in RANGES) + 1) if not TABLE.isRowHidden(row)]
+    COLUMNS: List[int] = [col for col in range(min(r.leftColumn() for r in RANGES), max(r.rightColumn() for r in RANGES) + 1) if not TABLE.isColumnHidden(col)]
+    SELECTED: set = None
+    if len(RANGES) > 1:
+        SELECTED = {
+            (row, col)
+            for r in RANGES
+            for row in range(r.topRow(), r.bottomRow() + 1)
+            for col in range(r.leftColumn(), r.rightColumn() + 1)
+        }
+    cellWidget, item = TABLE.cellWidget, TABLE.item
+    LINES: List[str] = []
+    for row in ROWS:
+        CELLS: List[str] = []
+        for col in COLUMNS:
+            if SELECTED is not None and (row, col) not in SELECTED:
+                CELLS.append("")
+                continue
+            WIDGET = cellWidget(row, col)
+            if WIDGET is not None:
+                READER = _CELL_READERS.get(type(WIDGET))
+                TEXT = _TSV_TEXT(READER[0](WIDGET) if READER else WIDGET_RD(WIDGET))
+            else:
+                ITEM = item(row, col)
+                if ITEM is None:
+                    TEXT = ""
+                elif ITEM.data(Qt.ItemDataRole.UserRole) == "checkable":
+                    TEXT = "TRUE" if ITEM.checkState() == Qt.CheckState.Checked else "FALSE"
+                else:
+                    TEXT = ITEM.text()
+            if "\t" in TEXT or "\n" in TEXT or "\r" in TEXT or '"' in TEXT:
+                TEXT = '"' + TEXT.replace('"', '""') + '"'
+            CELLS.append(TEXT)
+        LINES.append("\t".join(CELLS))
+    TSV: str = "\n".join(LINES)
+    if CLIPBOARD:
+        QApplication.clipboard().setText(TSV)
+    return TSV
+
+def TBL_PASTE_TSV(TABLE: QTableWidget, TEXT: str = None, ROW: int = None, COLUMN: Union[int, str] = None) -> int:
+    '''
+    Paste a TSV text (default: system clipboard) with the top-left corner in the selected cell
+
+    VARIABLES:
+        - ROW / COLUMN: top-left cell (default: top-left cell of the selection / current cell)
+
+    The block is written in a single batched update (see TBL_WRITE_BLOCK) and clipped to the table size
+
+    ** If the selection is a whole multiple of the block, the block is repeated to fill it (Excel)
+    ** Protected cells are skipped: PROTECTED_COLUMNS, CELL_READONLY items and disabled cell widgets
+    ** Hidden rows / columns are skipped
+    ** Cell widgets and CELL_CHECKITEM cells are written with WIDGET_WR
+
+    `Returns:` number of cells written
+    '''
+    if TEXT is None:
+        TEXT = QApplication.clipboard().text()
+    BLOCK: List[List[str]] = _TSV_ROWS(TEXT)
+    if not BLOCK:
+        return 0
+    N_ROWS: int = len(BLOCK)
+    N_COLUMNS: int = max(len(cells) for cells in BLOCK)
+    if N_COLUMNS == 0:
+        return 0
+    ## TARGET
+    RANGES = TABLE.selectedRanges()
+    if ROW is None:
+        ROW = min(r.topRow() for r in RANGES) if RANGES else max(TABLE.currentRow(), 0)
+    if COLUMN is None:
+        COLUMN_INDEX: int = min(r.leftColumn() for r in RANGES) if RANGES else max(TABLE.currentColumn(), 0)
+    else:
+        COLUMN_INDEX: int = TBL_GET_HEADER_INDEX(TABLE, COLUMN)
+    TARGET_ROWS: List[int] = [row for row in range(ROW, TABLE.rowCount()) if not TABLE.isRowHidden(row)]
+    TARGET_COLUMNS: List[int] = [col for col in range(COLUMN_INDEX, TABLE.columnCount()) if not TABLE.isColumnHidden(col)]
+    ROWS_COUNT, COLUMNS_COUNT = N_ROWS, N_COLUMNS
+    if len(RANGES) == 1 and RANGES[0].topRow() == ROW and RANGES[0].leftColumn() == COLUMN_INDEX:
+        HEIGHT = sum(1 for row in range(ROW, RANGES[0].bottomRow() + 1) if not TABLE.isRowHidden(row))
+        WIDTH = sum(1 for col in range(COLUMN_INDEX, RANGES[0].rightColumn() + 1) if not TABLE.isColumnHidden(col))
+        if HEIGHT % N_ROWS == 0 and WIDTH % N_COLUMNS == 0:
+            ROWS_COUNT, COLUMNS_COUNT = HEIGHT, WIDTH
+    TARGET_ROWS = TARGET_ROWS[:ROWS_COUNT]
+    TARGET_COLUMNS = TARGET_COLUMNS[:COLUMNS_COUNT]
+    if not TARGET_ROWS or not TARGET_COLUMNS:
+        return 0
+    ## WRITE
+    PROTECTED: set = getattr(TABLE, "_protected_columns", set())
+    EDITABLE, CHECKABLE = Qt.ItemFlag.ItemIsEditable, Qt.ItemFlag.ItemIsUserCheckable
+    cellWidget, item, setItem = TABLE.cellWidget, TABLE.item, TABLE.setItem
+    WRITTEN: int = 0
+    with _TBL_BATCH(TABLE, TARGET_ROWS[0], TARGET_COLUMNS[0], TARGET_ROWS[-1] - TARGET_ROWS[0] + 1, TARGET_COLUMNS[-1] - TARGET_COLUMNS[0] + 1):
+        for i, row in enumerate(TARGET_ROWS):
+            CELLS: List[str] = BLOCK[i % N_ROWS]
+            for j, col in enumerate(TARGET_COLUMNS):
+                if col in PROTECTED:
+                    continue
+                j %= N_COLUMNS
+                if j >= len(CELLS): # Ragged rows
+                    continue
+                VALUE: str = CELLS[j]
+                WIDGET = cellWidget(row, col)
+                if WIDGET is not None:
+                    if not WIDGET.isEnabled(): # CELL_READONLY
+                        continue
+                    try:
+                        WIDGET_WR(WIDGET, VALUE)
+                    except (TypeError, ValueError): # Not a value of the widget (QSpinBox: "abc")
+                        continue
+                    WRITTEN += 1
+                    continue
+                ITEM = item(row, col)
+                if ITEM is None:
+                    if not VALUE: # Empty over an empty cell: nothing written
+                        continue
+                    setItem(row, col, QTableWidgetItem(VALUE))
+                else:
+                    FLAGS = ITEM.flags()
+                    if FLAGS & EDITABLE:
+                        ITEM.setText(VALUE)
+                    elif FLAGS & CHECKABLE and ITEM.data(Qt.ItemDataRole.UserRole) == "checkable": # CELL_CHECKITEM
+                        ITEM.setCheckState(Qt.CheckState.Checked if _CHECKED(VALUE) else Qt.CheckState.Unchecked)
+                    else:
+                        continue
+                WRITTEN += 1
+    return WRITTEN
+
+def TBL_CLIPBOARD_INSTALL(TABLE: QTableWidget) -> Tuple[QShortcut, QShortcut]:
+    '''
+    Install the Copy / Paste shortcuts (Ctrl+C / Ctrl+V) of the table with TBL_COPY_TSV / TBL_PASTE_TSV
+
+    `Returns:` (copy, paste) QShortcut
+    '''
+    COPY = QShortcut(QKeySequence.StandardKey.Copy, TABLE, lambda: TBL_COPY_TSV(TABLE))
+    PASTE = QShortcut(QKeySequence.StandardKey.Paste, TABLE, lambda: TBL_PASTE_TSV(TABLE))
+    for SHORTCUT in (COPY, PASTE):
+        SHORTCUT.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+    return COPY, PASTE
+
 def TBL_VHEADER_WIDTH_FIX(TABLE: QTableWidget, COLUMNS: List[int] | List[str] | Tuple[int] | Tuple[str]):
     '''
     Set the field selected in COLUMNS list as fixed column width
@@ -0,0 +1,454 @@
+'''
+Headless benchmark of the widgets / forms hot paths
+
+Every (benchmark, size) runs in a fresh subprocess under the "offscreen" Qt platform
+and records the time, the Python peak memory (tracemalloc, measured in a second run)
+and the process peak RSS.
+
+USE:
+    python test/benchmark.py                        # run and compare with the baseline
+    python test/benchmark.py --sizes 1000           # only the 1k rows datasets
+    python test/benchmark.py --only TBL_GET_PANDAS_DF CELL_WR_RD
+    python test/benchmark.py --save                 # run and store the results as the new baseline
+    python test/benchmark.py --only IMPORTS         # only the import time check
+
+IMPORTS:
+    Import time of each module (fresh interpreter, best of 3) and the lazy import check:
+    the modules in LAZY_IMPORTS must not be loaded by a bare import, the run fails (exit 1) if they are
+
+WARNINGS:
+    - Baseline values are machine dependent, save a baseline on the machine used to compare
+      (benchmark_baseline.json is local, ignored by git; without it the ratios aren't shown)
+    - Each benchmark has a maximum size (LIMIT), bigger sizes are skipped unless --no-limit
+'''
+
+''' SYSTEM LIBRARIES '''
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+''' EXTERNAL LIBRARIES '''
+import numpy as np
+import pandas as pd
+
+''' INTERNAL LIBRARIES '''
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+
+''' CONTENT
+________________________________________________________________________________________________ '''
+
+BASELINE: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+SIZES: tuple = (1_000, 100_000, 1_000_000)
+
+def DATAFRAME(ROWS: int) -> pd.DataFrame:
+    '''
+    Synthetic DataFrame (fixed seed): int, float, bool, str and datetime columns
+    '''
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "ID": np.arange(ROWS),
+        "VALUE": rng.random(ROWS),
+        "ENABLED": rng.random(ROWS) > 0.5,
+        "NAME": [f"ITEM_{i:07d}" for i in range(ROWS)],
+        "DATE": pd.Timestamp("2025-01-01") + pd.to_timedelta(np.arange(ROWS) % 86400, unit="s"),
+    })
+
+def APP():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+class BENCHMARKS:
+    '''
+    Benchmark functions: SETUP(size) -> context (not timed), RUN(context) (timed)
+    '''
+    REGISTRY: Dict[str, dict] = {}
+
+    @classmethod
+    def add(cls, LIMIT: int = SIZES[-1], SIZED: bool = True) -> Callable:
+        def decorator(setup: Callable) -> Callable:
+            cls.REGISTRY[setup.__name__] = {"setup": setup, "limit": LIMIT, "sized": SIZED}
+            return setup
+        return decorator
+
+@BENCHMARKS.add(LIMIT=100_000)
+def TBL_POP_PANDAS_DF(SIZE: int):
+    from PySide6.QtWidgets import QTableWidget
+    from easypyside.widgets import TBL_POP_PANDAS_DF
+    table, df = QTableWidget(), DATAFRAME(SIZE)
+    return lambda: TBL_POP_PANDAS_DF(table, df, PROTECTED_COLUMNS=["ID"])
+
+@BENCHMARKS.add(LIMIT=100_000)
+def TBL_POP_PANDAS_DF_FIRST_SCREEN(SIZE: int):
+    from PySide6.QtWidgets import QTableWidget
+    from easypyside.widgets import TBL_POP_PANDAS_DF
+    table, df = QTableWidget(), DATAFRAME(SIZE)
+    table.resize(800, 600)
+    return lambda: TBL_POP_PANDAS_DF(table, df, CHUNKED=True).cancel()
+
+@BENCHMARKS.add()
+def TBL_POP_PANDAS_MODEL(SIZE: int):
+    from PySide6.QtWidgets import QTableView
+    from easypyside.widgets import TBL_POP_PANDAS_MODEL
+    table, df = QTableView(), DATAFRAME(SIZE)
+    return lambda: TBL_POP_PANDAS_MODEL(table, df, PROTECTED_COLUMNS=["ID"])
+
+@BENCHMARKS.add(LIMIT=100_000)
+def TBL_GET_PANDAS_DF(SIZE: int):
+    from PySide6.QtWidgets import QTableWidget
+    from easypyside.widgets import TBL_POP_PANDAS_DF, TBL_GET_PANDAS_DF
+    table = QTableWidget()
+    TBL_POP_PANDAS_DF(table, DATAFRAME(SIZE))
+    return lambda: TBL_GET_PANDAS_DF(table)
+
+@BENCHMARKS.add(LIMIT=100_000)
+def TBL_UPDATE_PANDAS_DF(SIZE: int):
+    from PySide6.QtWidgets import QTableWidget
+    from easypyside.widgets import TBL_POP_PANDAS_DF, TBL_UPDATE_PANDAS_DF
+    table, df = QTableWidget(), DATAFRAME(SIZE)
+    TBL_POP_PANDAS_DF(table, df)
+    new = df.copy()
+    rows = np.random.default_rng(1).choice(SIZE, max(1, SIZE // 100), replace=False)
+    new.iloc[rows, 1] = -1.0 # 1% of the rows changed
+    return lambda: TBL_UPDATE_PANDAS_DF(table, new)
+
+@BENCHMARKS.add(LIMIT=100_000)
+def CELL_WR_RD(SIZE: int):
+    from PySide6.QtWidgets import QTableWidget
+    from easypyside.widgets import CELL_WR, CELL_RD
+    table = QTableWidget(SIZE // 10, 10)
+    table.setHorizontalHeaderLabels([f"C{i}" for i in range(10)])
+    headers = [f"C{i}" for i in range(10)]
+    def run():
+        for row in range(SIZE // 10):
+            for column in headers:
+                CELL_WR(table, row, column, row)
+        for row in range(SIZE // 10):
+            for column in headers:
+                CELL_RD(table, row, column)
+    return run
+
+@BENCHMARKS.add(LIMIT=100_000)
+def TBL_WRITE_BLOCK(SIZE: int):
+    from PySide6.QtWidgets import QTableWidget
+    from easypyside.widgets import TBL_WRITE_BLOCK
+    table = QTableWidget(SIZE // 10, 10)
+    values = np.random.default_rng(0).random((SIZE // 10, 10))
+    return lambda: TBL_WRITE_BLOCK(table, 0, 0, values)
+
+@BENCHMARKS.add(LIMIT=100_000)
+def TBL_PASTE_TSV(SIZE: int):
+    from PySide6.QtWidgets import QTableWidget
+    from easypyside.widgets import TBL_PASTE_TSV
+    table = QTableWidget(SIZE // 10, 10)
+    text = "\n".join("\t".join(f"{value:.4f}" for value in row) for row in np.random.default_rng(0).random((SIZE // 10, 10)))
+    TBL_PASTE_TSV(table, text, 0, 0) # paste over existing items
+    return lambda: TBL_PASTE_TSV(table, text, 0, 0)
+
+@BENCHMARKS.add(LIMIT=100_000)
+def TBL_COPY_TSV(SIZE: int):
+    from PySide6.QtWidgets import QTableWidget
+    from easypyside.widgets import TBL_WRITE_BLOCK, TBL_COPY_TSV
+    table = QTableWidget(SIZE // 10, 10)
+    TBL_WRITE_BLOCK(table, 0, 0, np.random.default_rng(0).random((SIZE // 10, 10)))
+    table.selectAll()
+    return lambda: TBL_COPY_TSV(table, CLIPBOARD=False)
+
+@BENCHMARKS.add(LIMIT=100_000)
+def WIDGET_WR_RD(SIZE: int):
+    from PySide6.QtWidgets import QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox, QCheckBox, QDateEdit
+    from easypyside.widgets import WIDGET_WR, WIDGET_RD
+    combo = QComboBox()
+    combo.addItems(["A", "B"])
+    widgets = [(QLineEdit(), "TEXT"), (combo, "B"), (QSpinBox(), 5), (QDoubleSpinBox(), 1.5), (QCheckBox(), True), (QDateEdit(), "2025-01-01")]
+    def run():
+        for i in range(SIZE // len(widgets)):
+            for widget, value in widgets:
+                WIDGET_WR(widget, value)
+                WIDGET_RD(widget)
+    return run
+
+@BENCHMARKS.add(LIMIT=100_000)
+def FORM_ICON(SIZE: int):
+    from PySide6.QtWidgets import QMessageBox
+    from easypyside.forms import _ICO_INFO
+    def run(): # 1 message box per 100 rows, icon painted once
+        for _ in range(SIZE // 100):
+            box = QMessageBox()
+            box.setWindowIcon(_ICO_INFO())
+            box.windowIcon().pixmap(32)
+            box.deleteLater()
+    return run
+
+@BENCHMARKS.add(LIMIT=100_000)
+def FORM_INFOBOX(SIZE: int):
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+    from easypyside.forms import INFOBOX
+    def run(): # 1 prompt per 100 rows, closed as soon as it's shown
+        for _ in range(SIZE // 100):
+            QTimer.singleShot(0, lambda: QApplication.activeModalWidget().done(0))
+            INFOBOX("INFO")
+    return run
+
+@BENCHMARKS.add()
+def FORM_QLIST(SIZE: int):
+    from easypyside.forms import QLIST
+    items = [f"PART_{i:07d}" for i in range(SIZE)]
+    return lambda: QLIST(items)
+
+@BENCHMARKS.add()
+def FORM_QLIST_FILTER(SIZE: int):
+    from easypyside.forms import QLIST
+    items = [f"PART_{(i * 7919) % SIZE:07d}" for i in range(SIZE)]
+    form = QLIST(items)
+    while form.index is None: # built in a worker thread
+        APP().processEvents()
+    target = items[SIZE // 3]
+    def run(): # type an item char by char, then clear the filter
+        for i in range(1, len(target) + 1):
+            form.ui.tx_filter.setText(target[:i])
+        form.ui.tx_filter.setText("")
+    return run
+
+@BENCHMARKS.add()
+def FORM_QLIST_FORM(SIZE: int):
+    from easypyside.forms import QLIST_FORM
+    items = [f"PART_{i:07d}" for i in range(SIZE)]
+    return lambda: QLIST_FORM(items)
+
+@BENCHMARKS.add()
+def FORM_QLIST_FORM_EDIT(SIZE: int):
+    from easypyside.forms import QLIST_FORM
+    form = QLIST_FORM([f"PART_{i:07d}" for i in range(SIZE)])
+    blocks = [(SIZE // 10, SIZE // 20), (SIZE // 2, SIZE // 20)]
+    pasted = "\n".join(f"NEW_{i:07d}" for i in range(1000))
+    def run(): # multi-selection moves, paste and delete (buttons / Ctrl+V path, no prompt)
+        form._SELECT(blocks)
+        for _ in range(10):
+            form.ITEM_UP()
+        for _ in range(10):
+            form.ITEM_DOWN()
+        for i in range(100): # scattered selection (ctrl+click)
+            form._SELECT([(row, 1) for row in range(i, SIZE, max(1, SIZE // 100))])
+            form.ITEM_DOWN()
+        form.ITEMS_PASTE(pasted)
+        form.model.remove(form._SELECTED_RUNS())
+    return run
+
+@BENCHMARKS.add(LIMIT=100_000)
+def FORM_QACQUISITIONS(SIZE: int):
+    from easypyside.forms import QACQUISITIONS
+    values = {"MEASURE": list(np.random.default_rng(0).random(SIZE)), "INDICATION": []}
+    return lambda: QACQUISITIONS(values)
+
+@BENCHMARKS.add(LIMIT=100_000)
+def FORM_QACQUISITIONS_ADD_DEL(SIZE: int):
+    from easypyside.forms import QACQUISITIONS
+    form = QACQUISITIONS({"MEASURE": [], "INDICATION": []})
+    def run(): # 1 add per 10 rows (operator input), then delete half of them from the top
+        for i in range(SIZE // 10):
+            form.ui.tx_value.setText(str(i))
+            form.ui.cb_type.setCurrentIndex(i % 2)
+            form.VALUE_ADD()
+        for _ in range(SIZE // 20):
+            form.ui.tbl_values.selectRow(0)
+            form.VALUE_DEL()
+    return run
+
+@BENCHMARKS.add()
+def FORM_QACQUISITIONS_PUSH(SIZE: int):
+    import threading
+    from easypyside.forms import QACQUISITIONS
+    form = QACQUISITIONS({"MEASURE": [], "INDICATION": []})
+    form.show() # the timer drains while the dialog is shown
+    def worker():
+        for i in range(SIZE):
+            form.PUSH("MEASURE" if i % 2 else "INDICATION", float(i))
+    def run(): # samples pushed from a worker thread, drained by the GUI thread (timer)
+        thread = threading.Thread(target=worker)
+        thread.start()
+        while thread.is_alive() or form.store.size < SIZE:
+            APP().processEvents()
+    return run
+
+@BENCHMARKS.add()
+def FORM_QACQUISITIONS_JOURNAL(SIZE: int):
+    import tempfile
+    from easypyside.forms import QACQUISITIONS
+    path = os.path.join(tempfile.mkdtemp(), "acquisitions.journal")
+    form = QACQUISITIONS({"MEASURE": [], "INDICATION": []}, JOURNAL=path)
+    form.store.extend("MEASURE", np.random.default_rng(0).random(SIZE))
+    for _ in range(100): # some deleted rows
+        form.store.remove(form.store.size - 1)
+    form.journal.close()
+    return lambda: QACQUISITIONS(JOURNAL=path) # recovery
+
+@BENCHMARKS.add()
+def FORM_QACQUISITIONS_PASTE(SIZE: int):
+    from easypyside.forms import QACQUISITIONS
+    form = QACQUISITIONS({"MEASURE": [], "INDICATION": []})
+    text = "\n".join(f"{value:.3f}m" for value in np.random.default_rng(0).random(SIZE))
+    return lambda: form.VALUES_PASTE(text, "MEASURE")
+
+@BENCHMARKS.add(LIMIT=1_000)
+def FORM_QTABLE_FORM(SIZE: int):
+    from easypyside.forms import QTABLE_FORM
+    values = [True, "TEXT", 1, 1.5, ["A", "B"]]
+    config = [QTABLE_FORM.configValue(f"FIELD_{i}", values[i % len(values)]) for i in range(SIZE)]
+    return lambda: QTABLE_FORM(config)
+
+@BENCHMARKS.add(SIZED=False)
+def FORM_QMARKDOWN(SIZE: int):
+    from easypyside.forms import QMARKDOWN
+    return lambda: QMARKDOWN("# TITLE\n\n- item\n- item\n\n**bold**")
+
+@BENCHMARKS.add(SIZED=False)
+def FORM_QTEXT_FORM(SIZE: int):
+    from easypyside.forms import QTEXT_FORM
+    return lambda: QTEXT_FORM("TEXT")
+
+LAZY_IMPORTS: Dict[str, tuple] = {
+    "easypyside": ("PySide6", "pandas", "numpy", "easypyside.widgets", "easypyside.forms"),
+    "easypyside.tools": ("PySide6.QtTest", "pandas", "numpy", "easypyside.resources"),
+    "easypyside.widgets": ("pandas", "numpy", "PySide6.QtTest", "easypyside.resources"),
+    "easypyside.forms": ("pandas", "numpy", "markdown2", "easypyside.resources", "easypyside.__forms.PYSIDE_"),
+}
+
+IMPORT_CODE: str = '''
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": sorted(sys.modules)}}))
+'''
+
+def RUN_IMPORT(MODULE: str, REPEAT: int = 3) -> dict:
+    '''
+    Import time of a module in a fresh interpreter (best of REPEAT) and the lazy modules loaded by the import
+    '''
+    seconds: list = []
+    for _ in range(REPEAT):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_CODE.format(module=MODULE)],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        if result.returncode != 0:
+            return {"error": (result.stderr.strip().splitlines() or ["?"])[-1]}
+        output = json.loads(result.stdout.strip().splitlines()[-1])
+        seconds.append(output["seconds"])
+    loaded = [name for name in output["modules"] if name.startswith(LAZY_IMPORTS[MODULE])]
+    return {"seconds": min(seconds), "loaded": loaded}
+
+def RUN_ONE(NAME: str, SIZE: int) -> dict:
+    '''
+    Run a benchmark in the current process (child)
+    '''
+    APP()
+    setup = BENCHMARKS.REGISTRY[NAME]["setup"]
+    ## TIME (without tracemalloc overhead)
+    run = setup(SIZE)
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+    ## PYTHON PEAK MEMORY (second run)
+    run = setup(SIZE)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": seconds,
+        "py_peak_mb": peak / 2**20,
+        "rss_peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10,
+    }
+
+def RUN_SUBPROCESS(NAME: str, SIZE: int) -> dict:
+    '''
+    Run a benchmark in a fresh process (clean peak RSS)
+    '''
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", NAME, str(SIZE)],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return {"error": (result.stderr.strip().splitlines() or ["?"])[-1]}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def MAIN() -> None:
+    parser = argparse.ArgumentParser(description="easypyside headless benchmark")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--only", nargs="+", default=None)
+    parser.add_argument("--save", action="store_true", help="store the results as baseline")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--no-limit", action="store_true", help="ignore the maximum size of each benchmark")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(RUN_ONE(args.child[0], int(args.child[1]))))
+        return
+
+    baseline: dict = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    results: dict = {}
+    failed: bool = False
+    if not args.only or "IMPORTS" in args.only:
+        print(f"{'IMPORT':<32}{'TIME (s)':>22}{'vs BASELINE':>42}")
+        for module in LAZY_IMPORTS:
+            key = f"IMPORT[{module}]"
+            result = RUN_IMPORT(module)
+            if "error" in result:
+                print(f"{module:<32}  ERROR: {result['error']}")
+                failed = True
+                continue
+            results[key] = {"seconds": result["seconds"]}
+            ratio = ""
+            if key in baseline and "seconds" in baseline[key]:
+                ratio = f"x{result['seconds'] / baseline[key]['seconds']:.2f}"
+            print(f"{module:<32}{result['seconds']:>22.4f}{ratio:>42}")
+            if result["loaded"]:
+                print(f"    LAZY IMPORT BROKEN, LOADED: {', '.join(result['loaded'])}")
+                failed = True
+        print()
+
+    print(f"{'BENCHMARK':<32}{'SIZE':>10}{'TIME (s)':>12}{'PY PEAK (MB)':>14}{'RSS PEAK (MB)':>15}{'vs BASELINE':>13}")
+    for name, config in BENCHMARKS.REGISTRY.items():
+        if args.only and name not in args.only:
+            continue
+        sizes = sorted(args.sizes) if config["sized"] else sorted(args.sizes)[:1]
+        for size in sizes:
+            if size > config["limit"] and not args.no_limit:
+                continue
+            key = f"{name}[{size}]"
+            result = RUN_SUBPROCESS(name, size)
+            results[key] = result
+            if "error" in result:
+                print(f"{name:<32}{size:>10}  ERROR: {result['error']}")
+                continue
+            ratio = ""
+            if key in baseline and "seconds" in baseline[key]:
+                ratio = f"x{result['seconds'] / baseline[key]['seconds']:.2f}"
+            print(f"{name:<32}{size:>10}{result['seconds']:>12.4f}{result['py_peak_mb']:>14.1f}{result['rss_peak_mb']:>15.1f}{ratio:>13}")
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f"BASELINE SAVED: {args.baseline}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    MAIN()
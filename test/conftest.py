@@ -0,0 +1,18 @@
+'''
+Shared fixtures of the regression tests (headless: Qt "offscreen" platform)
+
+USE:
+    python -m pytest test
+'''
+import os
+import sys
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp() -> QApplication:
+    return QApplication.instance() or QApplication([])
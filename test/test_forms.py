@@ -0,0 +1,142 @@
+'''
+Regression tests of easypyside.forms
+'''
+import os
+import threading
+
+import numpy as np
+import pytest
+from PySide6.QtCore import Qt, QEvent
+
+from easypyside.forms import QACQUISITIONS, QLIST_FORM, AcquisitionsJournal, AcquisitionsStore
+from easypyside.tools import SCHEDULER_GET
+
+
+## ACQUISITIONS JOURNAL (user-020)
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / "session.acq")
+
+
+def test_journal_closed_with_the_form(qapp, journal_path, tmp_path):
+    PENDING = SCHEDULER_GET().pending()
+    FORMS = [QACQUISITIONS({"V": [1.0]}, JOURNAL=journal_path), QACQUISITIONS({"V": [2.0]}, JOURNAL=str(tmp_path / "other.acq"))]
+    assert SCHEDULER_GET().pending() == PENDING + 2
+    FORMS[0].close()
+    FORMS[1].deleteLater()
+    del FORMS
+    qapp.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert SCHEDULER_GET().pending() == PENDING
+    assert os.path.isfile(journal_path)
+
+
+def test_journal_open_closes_the_previous(qapp, journal_path, tmp_path):
+    PENDING = SCHEDULER_GET().pending()
+    FORM = QACQUISITIONS({"V": [1.0]}, JOURNAL=journal_path)
+    OLD = FORM.journal
+    FORM.JOURNAL_OPEN(str(tmp_path / "other.acq"))
+    assert not OLD.is_open()
+    assert SCHEDULER_GET().pending() == PENDING + 1
+    FORM.journal.close()
+    assert FORM.store.journal is None
+    assert SCHEDULER_GET().pending() == PENDING
+
+
+def test_journal_roundtrip_large_row_ids_and_edits(qapp, journal_path):
+    STORE = AcquisitionsStore(["V", "I"])
+    JOURNAL = AcquisitionsJournal(journal_path)
+    JOURNAL.start(STORE)
+    STORE.extend("V", [1.0, 2.0, 3.0])
+    STORE.extend("I", [0.5])
+    STORE.set(1, 20.0)
+    STORE.remove(0)
+    JOURNAL.remove(2**40) # row id out of the int32 range, unknown: ignored
+    JOURNAL.close()
+    LOADED = AcquisitionsJournal(journal_path).load()
+    assert LOADED.data == {"V": [20.0, 3.0], "I": [0.5]}
+    LOADED.journal.close()
+
+
+def test_journal_without_types_file(qapp, journal_path):
+    STORE = AcquisitionsStore(["V"])
+    JOURNAL = AcquisitionsJournal(journal_path)
+    JOURNAL.start(STORE)
+    STORE.extend("V", [1.0, 2.0])
+    JOURNAL.close()
+    os.remove(journal_path + ".types")
+    LOADED = AcquisitionsJournal(journal_path).load(["V"])
+    assert LOADED.data == {"V": []}
+    LOADED.extend("V", [4.0])
+    LOADED.journal.close()
+    assert AcquisitionsJournal(journal_path).load().data == {"V": [4.0]}
+
+
+def test_journal_loads_version_1(qapp, journal_path):
+    RECORDS = np.zeros(3, dtype=AcquisitionsJournal._RECORD(1))
+    RECORDS["op"] = [AcquisitionsJournal.ADD, AcquisitionsJournal.ADD, AcquisitionsJournal.DEL]
+    RECORDS["value"] = [1.0, 2.0, 0.0]
+    with open(journal_path, "wb") as file:
+        file.write(AcquisitionsJournal.MAGIC_V1 + RECORDS.tobytes())
+    with open(journal_path + ".types", "w", encoding="utf-8") as file:
+        file.write('"V"\n')
+    LOADED = AcquisitionsJournal(journal_path).load()
+    assert LOADED.data == {"V": [2.0]}
+    LOADED.journal.close()
+    with open(journal_path, "rb") as file:
+        assert file.read(len(AcquisitionsJournal.MAGIC)) == AcquisitionsJournal.MAGIC
+
+
+## ACQUISITIONS VALUES (user-017)
+
+def test_acquisitions_data_is_a_copy(qapp):
+    FORM = QACQUISITIONS({"V": [1.0, 2.0]})
+    FORM.data["V"].append(99.0)
+    FORM.data["V"][0] = -1.0
+    assert FORM.store.data == {"V": [1.0, 2.0]}
+    FORM.GET_VALUES()
+    assert FORM.data == {"V": [1.0, 2.0]}
+
+
+def test_acquisitions_value_edit(qapp):
+    FORM = QACQUISITIONS({"V": [1.0, 2.0]})
+    INDEX = FORM.model.index(1, 1)
+    assert FORM.model.flags(INDEX) & Qt.ItemFlag.ItemIsEditable
+    assert FORM.model.setData(INDEX, "3k")
+    assert not FORM.model.setData(INDEX, "abc")
+    assert FORM.data == {"V": [1.0, 3000.0]}
+    assert FORM.store.stats["V"].max == 3000.0
+
+
+## LIST FORM (user-025)
+
+def test_list_form_data_is_a_copy(qapp):
+    FORM = QLIST_FORM(["a", "b", "c"])
+    FORM.data.append("x")
+    assert FORM.model.items == ["a", "b", "c"]
+    FORM.show()
+    FORM._SELECT([(0, 1)])
+    FORM.ITEM_DOWN()
+    assert FORM.ITEMS_PASTE("d\ne") == 2
+    FORM.close()
+    assert FORM.data == ["b", "a", "d", "e", "c"] # pasted after the selection
+    assert FORM.data is not FORM.model.items
+
+
+## ACQUISITIONS PUSH (user-018)
+
+def test_push_new_type_from_worker_thread(qapp):
+    FORM = QACQUISITIONS({"V": []})
+    def WORKER():
+        for value in range(100):
+            FORM.PUSH("V", float(value))
+            FORM.PUSH("NEW", -float(value))
+        FORM.PUSH_MANY("MANY", [1.0, 2.0])
+    THREAD = threading.Thread(target=WORKER)
+    THREAD.start()
+    THREAD.join()
+    assert FORM.DRAIN() == 202
+    assert [FORM.ui.cb_type.itemText(item) for item in range(FORM.ui.cb_type.count())] == ["V", "NEW", "MANY"]
+    assert FORM.store.data["NEW"] == [-float(value) for value in range(100)]
+    assert FORM.VALUES_PASTE("5", TYPE="PASTED") == []
+    assert FORM.ui.cb_type.findText("PASTED") == 3
@@ -0,0 +1,23 @@
+'''
+Regression tests of easypyside.tools
+'''
+from easypyside.tools import PrefixIndex
+
+
+## PREFIX INDEX (user-024)
+
+def test_prefix_index_matches_startswith():
+    ITEMS = ["beta", "Alpha", "alpine", "al", "ALPHABET", "gamma", "", "b" * 70 + "x", "b" * 70 + "y"]
+    INDEX = PrefixIndex(ITEMS, CHUNK=3)
+    assert INDEX.keys.dtype.itemsize // 4 == PrefixIndex.KEY_LENGTH
+    for PREFIX in ["a", "AL", "alph", "alphabets", "b", "b" * 70 + "y", "z", ""]:
+        EXPECTED = [row for row, item in enumerate(ITEMS) if item.casefold().startswith(PREFIX.casefold())]
+        assert INDEX.rows(PREFIX).tolist() == EXPECTED
+    LO, HI = INDEX.range("a")
+    assert INDEX.range("alp", LO, HI) == INDEX.range("alp")
+
+
+def test_prefix_index_key_length_fits_items():
+    INDEX = PrefixIndex(["ab", "abc", "x"])
+    assert INDEX.keys.dtype.str.endswith("U3")
+    assert INDEX.rows("ab").tolist() == [0, 1]
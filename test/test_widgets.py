@@ -0,0 +1,112 @@
+'''
+Regression tests of easypyside.widgets
+'''
+import pandas as pd
+import pytest
+from PySide6.QtCore import Qt, QPoint
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QTableWidget, QTableWidgetItem
+
+from easypyside.widgets import CheckBoxCell, CELL_CHECKBOX, CELL_CHECKITEM, CELL_RD, WIDGET_CONNECT
+from easypyside.widgets import TBL_POP_PANDAS_DF, TBL_UPDATE_PANDAS_DF, TBL_PASTE_TSV
+
+
+## CHECK BOXES (user-002)
+
+@pytest.fixture
+def check_table(qapp):
+    TABLE = QTableWidget(3, 2)
+    TABLE.horizontalHeader().setDefaultSectionSize(120)
+    for row in range(3):
+        CELL_CHECKITEM(TABLE, row, 0, False)
+    TABLE.show()
+    QTest.qWaitForWindowExposed(TABLE)
+    yield TABLE
+    TABLE.close()
+
+def _click(TABLE: QTableWidget, POINT: QPoint) -> None:
+    QTest.mouseClick(TABLE.viewport(), Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier, POINT)
+
+def test_checkitem_click_outside_indicator_selects_cell(check_table):
+    RECT = check_table.visualItemRect(check_table.item(2, 0))
+    _click(check_table, QPoint(RECT.left() + 3, RECT.center().y()))
+    assert check_table.currentRow() == 2
+    assert CELL_RD(check_table, 2, 0) is False
+
+def test_checkitem_click_on_indicator_toggles(check_table):
+    _click(check_table, check_table.visualItemRect(check_table.item(1, 0)).center())
+    assert CELL_RD(check_table, 1, 0) is True
+    assert check_table.currentRow() == 1
+
+def test_checkitem_widget_connect(check_table):
+    STATES = []
+    WIDGET_CONNECT(check_table.item(0, 0), STATES.append)
+    check_table.item(0, 0).setCheckState(Qt.CheckState.Checked)
+    check_table.item(0, 0).setText("") # not a toggle
+    assert STATES == [Qt.CheckState.Checked.value]
+
+def test_checkbox_keeps_cell_widget_api(qapp):
+    TABLE = QTableWidget(1, 1)
+    CHECKBOX = CELL_CHECKBOX(TABLE, 0, 0, True)
+    assert isinstance(CHECKBOX, CheckBoxCell)
+    assert TABLE.cellWidget(0, 0) is CHECKBOX
+    CHECKBOX.setChecked(False)
+    assert CHECKBOX.isChecked() is False
+    assert CELL_RD(TABLE, 0, 0) is False
+
+
+## INCREMENTAL UPDATE (user-008)
+
+def _cells(TABLE: QTableWidget) -> list:
+    return [[TABLE.item(row, col).text() if TABLE.item(row, col) else None for col in range(TABLE.columnCount())] for row in range(TABLE.rowCount())]
+
+def _nullable_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "N": pd.array([1, None, 3], dtype="Int64"),
+        "S": pd.array(["a", None, "c"], dtype="string"),
+        "B": pd.array([True, None, False], dtype="boolean"),
+    }, index=[10, 11, 12])
+
+def test_update_nullable_dtypes(qapp):
+    TABLE = QTableWidget()
+    DF = _nullable_df()
+    TBL_POP_PANDAS_DF(TABLE, DF)
+    FIRST = TABLE.item(0, 0)
+    NEW = DF.copy()
+    NEW.loc[11, "N"] = 2 # NA -> value
+    NEW.loc[10, "S"] = pd.NA # value -> NA
+    NEW.loc[12, "B"] = True
+    TBL_UPDATE_PANDAS_DF(TABLE, NEW)
+    assert TABLE.item(0, 0) is FIRST # incremental, not repopulated
+    assert _cells(TABLE) == [["1", None, "True"], ["2", None, None], ["3", "c", "True"]]
+
+def test_update_after_sort_matches_rows(qapp):
+    TABLE = QTableWidget()
+    DF = pd.DataFrame({"K": [5, 3, 1], "V": ["a", "b", "c"]}, index=[10, 11, 12])
+    TBL_POP_PANDAS_DF(TABLE, DF)
+    TABLE.sortItems(0)
+    NEW = DF.copy()
+    NEW.loc[11, "V"] = "CHANGED"
+    TBL_UPDATE_PANDAS_DF(TABLE, NEW.drop(index=12))
+    ROWS = _cells(TABLE)
+    assert ["3", "CHANGED"] in ROWS and len(ROWS) == 2
+
+def test_update_applies_hidden_and_protected_columns(qapp):
+    TABLE = QTableWidget()
+    DF = pd.DataFrame({"A": [1, 2], "B": ["x", "y"]})
+    TBL_POP_PANDAS_DF(TABLE, DF, HIDE_COLUMNS=["A"])
+    TBL_UPDATE_PANDAS_DF(TABLE, DF, HIDE_COLUMNS=["B"], PROTECTED_COLUMNS=["B"])
+    assert not TABLE.isColumnHidden(0) and TABLE.isColumnHidden(1)
+    assert all(not TABLE.item(row, 1).flags() & Qt.ItemFlag.ItemIsEditable for row in range(2))
+    assert all(TABLE.item(row, 0).flags() & Qt.ItemFlag.ItemIsEditable for row in range(2))
+    TBL_UPDATE_PANDAS_DF(TABLE, DF)
+    assert all(TABLE.item(row, 1).flags() & Qt.ItemFlag.ItemIsEditable for row in range(2))
+
+
+## PASTE (user-022)
+
+def test_paste_counts_only_written_cells(qapp):
+    TABLE = QTableWidget(2, 3)
+    TABLE.setItem(0, 0, QTableWidgetItem("x"))
+    assert TBL_PASTE_TSV(TABLE, "\tb\t\n1\t\tc", 0, 0) == 4 # empty values over missing items are skipped
+    assert _cells(TABLE) == [["", "b", None], ["1", None, "c"]]